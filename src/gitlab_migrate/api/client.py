@@ -1,15 +1,20 @@
 """GitLab API client implementation."""
 
 import asyncio
-import json
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-import aiohttp
 import requests
 from loguru import logger
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config.config import GitLabInstanceConfig
 from .exceptions import (
@@ -19,6 +24,15 @@ from .exceptions import (
     GitLabRateLimitError,
 )
 
+try:
+    # orjson parses bytes directly and is several times faster than json
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    _json_dumps = None
+
 
 class APIResponse(BaseModel):
     """Standard API response wrapper."""
@@ -29,33 +43,95 @@ class APIResponse(BaseModel):
     success: bool
 
 
+# Maximum number of GET responses kept for conditional requests
+_CACHE_SIZE = 1024
+
+# Remaining budget at or below which every change is persisted, so a crashed
+# run never leaves a stale, too-high count in the rate-limit store
+_RATELIMIT_LOW_WATER = 10
+
+_COMMON_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'gitlab-migrate/1.0.0',
+}
+
+
+def _json_body(data: Any) -> Dict[str, Any]:
+    """Build the request kwargs that send ``data`` as a JSON body."""
+    if data is None or _json_dumps is None:
+        return {'json': data}
+    # Content-Type is already set on the session headers
+    return {'data': _json_dumps(data)}
+
+
+@dataclass
+class RateLimitState:
+    """Request budget last advertised by the GitLab server."""
+
+    remaining: Optional[int] = None  # None until the server reports a budget
+    reset_at: float = 0.0  # Unix time at which the budget refills
+
+
 class GitLabClient:
     """GitLab API client with authentication."""
 
-    def __init__(self, config: GitLabInstanceConfig):
+    def __init__(self, config: GitLabInstanceConfig, max_workers: int = 5):
         """Initialize GitLab client.
 
         Args:
             config: GitLab instance configuration
+            max_workers: Number of workers sharing this client, used to size
+                the connection pool
         """
         self.config = config
         self.base_url = config.url.rstrip('/') + '/api/v4'
+        self._url_prefix = self.base_url + '/'
+        self.max_workers = max_workers
         self.session = requests.Session()
 
-        # Set authentication headers
+        # Keep enough pooled connections for every worker to reuse one, and
+        # retry idempotent requests on transient server errors
+        pool_size = max(10, max_workers * 2)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Build authentication headers once; both sync and async requests use them
         if config.token:
-            self.session.headers.update({'Private-Token': config.token})
+            auth_headers = {'Private-Token': config.token}
         elif config.oauth_token:
-            self.session.headers.update(
-                {'Authorization': f'Bearer {config.oauth_token}'}
-            )
+            auth_headers = {'Authorization': f'Bearer {config.oauth_token}'}
         else:
             raise GitLabAuthenticationError('No authentication token provided')
 
-        # Set common headers
-        self.session.headers.update(
-            {'Content-Type': 'application/json', 'User-Agent': 'gitlab-migrate/1.0.0'}
-        )
+        self._request_headers = MappingProxyType({**_COMMON_HEADERS, **auth_headers})
+        self.session.headers.update(self._request_headers)
+
+        self._ratelimit = RateLimitState()
+        # Optional SQLite store so a restarted run resumes the last known budget
+        self._rl_store = None
+        self._rl_lock = threading.Lock()
+        self._rl_saved_reset_at: Optional[float] = None
+        self._rl_saved_remaining: Optional[int] = None
+        if config.ratelimit_store:
+            self._open_rate_limit_store(Path(config.ratelimit_store).expanduser())
+
+        # aiohttp session, created on first async request and tied to its loop
+        self._aio_session = None
+        self._aio_loop = None
+
+        # GET response cache: key -> (stored_at, etag, response), in LRU order
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_ttl = config.cache_ttl
 
         logger.info(f'Initialized GitLab client for {config.url}')
 
@@ -68,7 +144,208 @@ class GitLabClient:
         Returns:
             Full API URL
         """
-        return urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        return self._url_prefix + endpoint.lstrip('/')
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+        """Build the response cache key for a GET request.
+
+        Pages of a collection are not cached: pagination streams them once, and
+        keeping them would defeat its bounded memory use.
+
+        Args:
+            url: Full API URL
+            params: Query parameters
+
+        Returns:
+            Hashable cache key, or None if the request should not be cached
+        """
+        if not params:
+            return (url, ())
+        if 'page' in params:
+            return None
+        return (url, tuple(sorted(params.items())))
+
+    def _cache_lookup(
+        self, key: Optional[Tuple]
+    ) -> Tuple[Optional[APIResponse], Optional[Dict[str, str]]]:
+        """Look up a cached GET response.
+
+        Args:
+            key: Cache key from _cache_key
+
+        Returns:
+            Tuple of (fresh cached response or None, conditional request headers)
+        """
+        entry = self._cache.get(key) if key is not None else None
+        if entry is None:
+            return None, None
+
+        stored_at, etag, cached = entry
+        self._cache.move_to_end(key)
+        if self._cache_ttl and time.monotonic() - stored_at < self._cache_ttl:
+            return cached.model_copy(deep=True), None
+
+        return None, {'If-None-Match': etag} if etag else None
+
+    def _cache_store(self, key: Optional[Tuple], response: APIResponse) -> None:
+        """Remember a successful GET response for later reuse.
+
+        A private copy is kept so callers mutating the response they got
+        cannot change what later hits return.
+
+        Args:
+            key: Cache key from _cache_key
+            response: Response to cache
+        """
+        etag = response.headers.get('ETag') or response.headers.get('etag')
+        if key is None or response.status_code != 200 or not (etag or self._cache_ttl):
+            return
+
+        self._cache[key] = (time.monotonic(), etag, response.model_copy(deep=True))
+        self._cache.move_to_end(key)
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _cache_revalidated(self, key: Tuple) -> APIResponse:
+        """Return the cached response after a 304 and restart its TTL.
+
+        Args:
+            key: Cache key from _cache_key
+
+        Returns:
+            Cached API response
+        """
+        _, etag, cached = self._cache[key]
+        self._cache[key] = (time.monotonic(), etag, cached)
+        return cached.model_copy(deep=True)
+
+    def _open_rate_limit_store(self, path: Path) -> None:
+        """Open the rate-limit store and prime state from it.
+
+        Persistence is only an optimisation, so any failure leaves the client
+        running with in-memory state.
+
+        Args:
+            path: SQLite database file
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            store = sqlite3.connect(str(path), check_same_thread=False)
+            store.execute(
+                'CREATE TABLE IF NOT EXISTS rl '
+                '(host TEXT PRIMARY KEY, remaining INT, reset_at REAL)'
+            )
+            row = store.execute(
+                'SELECT remaining, reset_at FROM rl WHERE host = ?',
+                (self.config.url,),
+            ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f'Rate-limit store {path} unavailable, not persisting: {e}')
+            return
+
+        self._rl_store = store
+        # A budget whose window has already passed tells us nothing
+        if row is not None and row[1] > time.time():
+            self._ratelimit.remaining, self._ratelimit.reset_at = row
+            self._rl_saved_remaining, self._rl_saved_reset_at = row
+
+    def _save_rate_limit(self, force: bool = False) -> None:
+        """Write the current rate-limit state to the store, if any.
+
+        A new window (a changed reset_at) is always written. Within a window,
+        changes are written only once the budget is at or below
+        _RATELIMIT_LOW_WATER. The store stays cheap while the budget is
+        healthy, and a crash never leaves it overstating a low budget.
+
+        Args:
+            force: Write even if the window has not changed
+        """
+        if self._rl_store is None:
+            return
+        state = self._ratelimit
+        if (
+            not force
+            and state.reset_at == self._rl_saved_reset_at
+            and (
+                state.remaining is None
+                or state.remaining > _RATELIMIT_LOW_WATER
+                or state.remaining == self._rl_saved_remaining
+            )
+        ):
+            return
+
+        with self._rl_lock:
+            if self._rl_store is None:
+                return
+            try:
+                with self._rl_store:
+                    self._rl_store.execute(
+                        'INSERT OR REPLACE INTO rl (host, remaining, reset_at) '
+                        'VALUES (?, ?, ?)',
+                        (self.config.url, state.remaining, state.reset_at),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f'Could not persist rate-limit state: {e}')
+                return
+            self._rl_saved_remaining = state.remaining
+            self._rl_saved_reset_at = state.reset_at
+
+    def _update_rate_limit(self, status_code: int, headers: Any) -> None:
+        """Track the server's request budget from response headers.
+
+        Args:
+            status_code: HTTP status code
+            headers: Case-insensitive response headers
+        """
+        if status_code == 429:
+            retry_after = int(headers.get('Retry-After', 60))
+            self._ratelimit.remaining = 0
+            self._ratelimit.reset_at = time.time() + retry_after
+            self._save_rate_limit()
+            return
+
+        remaining = headers.get('RateLimit-Remaining')
+        if remaining is not None:
+            self._ratelimit.remaining = int(remaining)
+            reset = headers.get('RateLimit-Reset')
+            if reset is not None:
+                self._ratelimit.reset_at = float(reset)
+            self._save_rate_limit()
+
+    def _rate_limit_delay(self) -> float:
+        """Seconds to hold off before the next request.
+
+        Every caller sees the same exhausted budget until reset_at passes, so
+        concurrent requests all wait out the window rather than just the first.
+
+        Returns:
+            Delay in seconds (0 when budget remains)
+        """
+        state = self._ratelimit
+        if state.remaining is None or state.remaining > 0:
+            return 0.0
+
+        delay = state.reset_at - time.time()
+        if delay <= 0:
+            # The budget has refilled; forget it until the server reports again
+            state.remaining = None
+            return 0.0
+
+        logger.warning(f'Rate limit budget exhausted, waiting {delay:.1f}s')
+        return delay
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block until the server's rate limit window allows another request."""
+        delay = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
+
+    async def _wait_for_rate_limit_async(self) -> None:
+        """Wait until the server's rate limit window allows another request."""
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
 
     def _handle_response(self, response: requests.Response) -> APIResponse:
         """Handle API response and convert to standard format.
@@ -82,6 +359,7 @@ class GitLabClient:
         Raises:
             GitLabAPIError: For various API errors
         """
+        self._update_rate_limit(response.status_code, response.headers)
         headers = dict(response.headers)
 
         # Handle rate limiting
@@ -102,21 +380,26 @@ class GitLabClient:
 
         # Handle other client/server errors
         if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                message = error_data.get('message', f'HTTP {response.status_code}')
-            except ValueError:
-                message = f'HTTP {response.status_code}: {response.text}'
+            error_data = None
+            message = f'HTTP {response.status_code}'
+            # Only GitLab's own JSON errors carry a message; HTML error pages
+            # from proxies are not worth reading
+            if 'json' in response.headers.get('Content-Type', ''):
+                try:
+                    error_data = _json_loads(response.content)
+                    message = error_data.get('message', message)
+                except (ValueError, AttributeError):
+                    pass
 
             raise GitLabAPIError(
                 f'API request failed: {message}',
                 status_code=response.status_code,
-                response_data=error_data if 'error_data' in locals() else None,
+                response_data=error_data,
             )
 
-        # Parse response data
+        # Parse response data straight from the body bytes
         try:
-            data = response.json() if response.content else None
+            data = _json_loads(response.content) if response.content else None
         except ValueError:
             data = response.text
 
@@ -127,6 +410,46 @@ class GitLabClient:
             success=200 <= response.status_code < 300,
         )
 
+    def _get_aio_session(self):
+        """Return the shared aiohttp session, creating it when needed.
+
+        A session is bound to the event loop it was created on. An open session
+        is never replaced from another loop, since it could not be closed there
+        and would leak its connections.
+
+        Returns:
+            aiohttp client session
+
+        Raises:
+            RuntimeError: If an open session belongs to another event loop
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._aio_session
+        if session is not None and not session.closed and self._aio_loop is not loop:
+            raise RuntimeError(
+                'aiohttp session belongs to another event loop; '
+                'call close_async() on that loop first'
+            )
+        if session is None or session.closed:
+            pool_size = max(10, self.max_workers * 2)
+            # Every request goes to one host, so resolve it once and reuse the
+            # answer rather than calling getaddrinfo per connection
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            session = aiohttp.ClientSession(
+                headers=self._request_headers, connector=connector
+            )
+            self._aio_session = session
+            self._aio_loop = loop
+        return session
+
     async def _make_request_async(
         self,
         method: str,
@@ -149,76 +472,69 @@ class GitLabClient:
         """
         url = self._build_url(endpoint)
 
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'gitlab-migrate/1.0.0',
-        }
-        if self.config.token:
-            headers['Private-Token'] = self.config.token
-        elif self.config.oauth_token:
-            headers['Authorization'] = f'Bearer {self.config.oauth_token}'
+        await self._wait_for_rate_limit_async()
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.request(
-                    method=method, url=url, params=params, json=data, **kwargs
-                ) as response:
-                    response_headers = dict(response.headers)
-
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = int(response_headers.get('Retry-After', 60))
-                        raise GitLabRateLimitError(
-                            f'Rate limit exceeded. Retry after {retry_after} seconds',
-                            retry_after=retry_after,
-                        )
-
-                    # Handle authentication errors
-                    if response.status == 401:
-                        raise GitLabAuthenticationError('Authentication failed')
-
-                    # Handle not found
-                    if response.status == 404:
-                        raise GitLabNotFoundError('Resource not found')
-
-                    # Handle other errors
-                    if response.status >= 400:
+        # Imported here so sync-only commands don't load aiohttp at startup
+        import aiohttp
+
+        session = self._get_aio_session()
+        try:
+            async with session.request(
+                method=method, url=url, params=params, **_json_body(data), **kwargs
+            ) as response:
+                self._update_rate_limit(response.status, response.headers)
+                response_headers = dict(response.headers)
+
+                # Handle rate limiting
+                if response.status == 429:
+                    retry_after = int(response_headers.get('Retry-After', 60))
+                    raise GitLabRateLimitError(
+                        f'Rate limit exceeded. Retry after {retry_after} seconds',
+                        retry_after=retry_after,
+                    )
+
+                # Handle authentication errors
+                if response.status == 401:
+                    raise GitLabAuthenticationError('Authentication failed')
+
+                # Handle not found
+                if response.status == 404:
+                    raise GitLabNotFoundError('Resource not found')
+
+                # Handle other errors
+                if response.status >= 400:
+                    error_data = None
+                    message = f'HTTP {response.status}'
+                    if 'json' in response.headers.get('Content-Type', ''):
                         try:
-                            error_data = await response.json()
-                            message = error_data.get(
-                                'message', f'HTTP {response.status}'
-                            )
-                        except (ValueError, aiohttp.ContentTypeError):
-                            message = f'HTTP {response.status}: {await response.text()}'
-
-                        raise GitLabAPIError(
-                            f'API request failed: {message}',
-                            status_code=response.status,
-                            response_data=error_data
-                            if 'error_data' in locals()
-                            else None,
-                        )
-
-                    # Parse response data
-                    try:
-                        response_text = await response.text()
-                        if response_text:
-                            response_data = json.loads(response_text)
-                        else:
-                            response_data = None
-                    except (ValueError, json.JSONDecodeError):
-                        response_data = response_text
-
-                    return APIResponse(
+                            error_data = _json_loads(await response.read())
+                            message = error_data.get('message', message)
+                        except (ValueError, AttributeError):
+                            pass
+
+                    raise GitLabAPIError(
+                        f'API request failed: {message}',
                         status_code=response.status,
-                        data=response_data,
-                        headers=response_headers,
-                        success=200 <= response.status < 300,
+                        response_data=error_data,
                     )
 
-            except aiohttp.ClientError as e:
-                logger.error(f'Network error during API request: {e}')
-                raise GitLabAPIError(f'Network error: {e}')
+                # Parse response data straight from the body bytes
+                body = await response.read()
+                try:
+                    response_data = _json_loads(body) if body else None
+                except ValueError:
+                    response_data = await response.text()
+
+                return APIResponse(
+                    status_code=response.status,
+                    data=response_data,
+                    headers=response_headers,
+                    success=200 <= response.status < 300,
+                )
+
+        except aiohttp.ClientError as e:
+            logger.error(f'Network error during API request: {e}')
+            raise GitLabAPIError(f'Network error: {e}')
 
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs
@@ -234,10 +550,24 @@ class GitLabClient:
             API response
         """
         url = self._build_url(endpoint)
+        key = self._cache_key(url, params)
+
+        cached, conditional = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        if conditional:
+            kwargs['headers'] = {**conditional, **kwargs.get('headers', {})}
+
+        self._wait_for_rate_limit()
 
         try:
             response = self.session.get(url, params=params, **kwargs)
-            return self._handle_response(response)
+            if response.status_code == 304 and key in self._cache:
+                return self._cache_revalidated(key)
+
+            api_response = self._handle_response(response)
+            self._cache_store(key, api_response)
+            return api_response
         except requests.RequestException as e:
             logger.error(f'Network error during GET request: {e}')
             raise GitLabAPIError(f'Network error: {e}')
@@ -257,8 +587,10 @@ class GitLabClient:
         """
         url = self._build_url(endpoint)
 
+        self._wait_for_rate_limit()
+
         try:
-            response = self.session.post(url, json=data, **kwargs)
+            response = self.session.post(url, **_json_body(data), **kwargs)
             return self._handle_response(response)
         except requests.RequestException as e:
             logger.error(f'Network error during POST request: {e}')
@@ -279,8 +611,10 @@ class GitLabClient:
         """
         url = self._build_url(endpoint)
 
+        self._wait_for_rate_limit()
+
         try:
-            response = self.session.put(url, json=data, **kwargs)
+            response = self.session.put(url, **_json_body(data), **kwargs)
             return self._handle_response(response)
         except requests.RequestException as e:
             logger.error(f'Network error during PUT request: {e}')
@@ -298,6 +632,8 @@ class GitLabClient:
         """
         url = self._build_url(endpoint)
 
+        self._wait_for_rate_limit()
+
         try:
             response = self.session.delete(url, **kwargs)
             return self._handle_response(response)
@@ -318,7 +654,22 @@ class GitLabClient:
         Returns:
             API response
         """
-        return await self._make_request_async('GET', endpoint, params=params, **kwargs)
+        key = self._cache_key(self._build_url(endpoint), params)
+
+        cached, conditional = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        if conditional:
+            kwargs['headers'] = {**conditional, **kwargs.get('headers', {})}
+
+        response = await self._make_request_async(
+            'GET', endpoint, params=params, **kwargs
+        )
+        if response.status_code == 304 and key in self._cache:
+            return self._cache_revalidated(key)
+
+        self._cache_store(key, response)
+        return response
 
     async def post_async(
         self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs
@@ -378,13 +729,32 @@ class GitLabClient:
         Returns:
             List of all items from all pages
         """
-        all_items = []
-        page = 1
+        all_items = list(self.iter_paginated(endpoint, params, per_page))
+
+        logger.info(f'Retrieved {len(all_items)} items from {endpoint}')
+        return all_items
+
+    def iter_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the items of a paginated endpoint one page at a time.
+
+        Each page is only requested once the previous one has been consumed,
+        so memory stays bounded by a single page.
 
-        if params is None:
-            params = {}
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Items per page
 
-        params['per_page'] = per_page
+        Yields:
+            Items from each page in order
+        """
+        params = dict(params or {}, per_page=per_page)
+        page = 1
 
         while True:
             params['page'] = page
@@ -397,7 +767,7 @@ class GitLabClient:
             if not items:
                 break
 
-            all_items.extend(items)
+            yield from items
 
             total_pages = response.headers.get('X-Total-Pages')
             if total_pages and page >= int(total_pages):
@@ -408,6 +778,94 @@ class GitLabClient:
 
             page += 1
 
+    async def batch_get(
+        self, endpoints: List[str]
+    ) -> List[Union[APIResponse, GitLabAPIError]]:
+        """Issue many GET requests concurrently.
+
+        Requests run at most max_workers at a time. A failing endpoint does not
+        abort the batch; its exception is returned in its slot instead.
+
+        Args:
+            endpoints: API endpoints to fetch
+
+        Returns:
+            Responses (or the raised GitLabAPIError) in endpoint order
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(endpoint: str) -> APIResponse:
+            async with semaphore:
+                return await self.get_async(endpoint)
+
+        results = await asyncio.gather(
+            *(fetch(endpoint) for endpoint in endpoints), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, GitLabAPIError
+            ):
+                raise result
+        return results
+
+    async def get_paginated_async(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Get all pages of a paginated endpoint, fetching pages concurrently.
+
+        The first page is fetched alone to learn X-Total-Pages; the remaining
+        pages are then requested in parallel, at most max_workers at a time.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Items per page
+
+        Returns:
+            List of all items from all pages, in page order
+        """
+        base_params = dict(params or {}, per_page=per_page)
+
+        first = await self.get_async(endpoint, params={**base_params, 'page': 1})
+        if not first.success or not first.data:
+            return []
+
+        all_items = list(first.data)
+        total_pages = first.headers.get('X-Total-Pages')
+
+        if total_pages:
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def fetch_page(page: int) -> APIResponse:
+                async with semaphore:
+                    return await self.get_async(
+                        endpoint, params={**base_params, 'page': page}
+                    )
+
+            responses = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, int(total_pages) + 1))
+            )
+            for response in responses:
+                if response.success and response.data:
+                    all_items.extend(response.data)
+        else:
+            # GitLab omits the total for very large collections; walk the
+            # remaining pages one at a time instead
+            page = 1
+            items = first.data
+            while len(items) >= per_page:
+                page += 1
+                response = await self.get_async(
+                    endpoint, params={**base_params, 'page': page}
+                )
+                items = response.data if response.success else None
+                if not items:
+                    break
+                all_items.extend(items)
+
         logger.info(f'Retrieved {len(all_items)} items from {endpoint}')
         return all_items
 
@@ -424,6 +882,19 @@ class GitLabClient:
             logger.error(f'Connection test failed: {e}')
             return False
 
+    async def test_connection_async(self) -> bool:
+        """Test connection to GitLab instance asynchronously.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            response = await self.get_async('/user')
+            return response.success
+        except Exception as e:
+            logger.error(f'Connection test failed: {e}')
+            return False
+
     def get_version(self) -> Optional[str]:
         """Get GitLab version.
 
@@ -442,8 +913,20 @@ class GitLabClient:
     def close(self):
         """Close the client session."""
         self.session.close()
+        if self._rl_store is not None:
+            self._save_rate_limit(force=True)
+            with self._rl_lock:
+                self._rl_store.close()
+                self._rl_store = None
         logger.info('GitLab client session closed')
 
+    async def close_async(self):
+        """Close the aiohttp session (if any) and the client session."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        self.close()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -457,11 +940,14 @@ class GitLabClientFactory:
     """Factory for creating GitLab API clients."""
 
     @staticmethod
-    def create_client(config: GitLabInstanceConfig) -> GitLabClient:
+    def create_client(
+        config: GitLabInstanceConfig, max_workers: int = 5
+    ) -> GitLabClient:
         """Create GitLab client from configuration.
 
         Args:
             config: GitLab instance configuration
+            max_workers: Number of workers that will share the client
 
         Returns:
             Configured GitLab client
@@ -474,4 +960,4 @@ class GitLabClientFactory:
                 'Either token or oauth_token must be provided'
             )
 
-        return GitLabClient(config)
+        return GitLabClient(config, max_workers=max_workers)
@@ -1,6 +1,7 @@
 """Main CLI entry point for GitLab Migration Tool."""
 
 import sys
+import atexit
 import asyncio
 from typing import Optional
 from pathlib import Path
@@ -23,6 +24,25 @@ from ..migration.engine import MigrationEngine
 
 console = Console()
 
+# Event loop shared by every command run in this process
+_runner = None
+
+
+def _run_async(coro):
+    """Run a coroutine on the CLI's shared event loop.
+
+    Falls back to asyncio.run() on Python versions without asyncio.Runner.
+    """
+    global _runner
+
+    if not hasattr(asyncio, 'Runner'):
+        return asyncio.run(coro)
+
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    return _runner.run(coro)
+
 
 @click.group()
 @click.version_option(version='0.1.0', prog_name='gitlab-migrate')
@@ -118,7 +138,7 @@ def migrate(ctx: click.Context, dry_run: bool) -> None:
             config.migration.dry_run = True
 
         # Run migration
-        asyncio.run(_run_migration(config, dry_run))
+        _run_async(_run_migration(config, dry_run))
 
     except Exception as e:
         console.print(f'[red]✗[/red] Migration failed: {e}')
@@ -144,7 +164,7 @@ def validate(ctx: click.Context) -> None:
 
         # Test connectivity to both instances
         engine = MigrationEngine(config)
-        asyncio.run(engine._test_connectivity())
+        _run_async(_check_connectivity(engine))
 
         console.print('[green]✓[/green] Connectivity validation passed')
         console.print('[green]✓[/green] Configuration validation completed')
@@ -236,6 +256,14 @@ def _setup_logging_with_config(ctx: click.Context, config: Config) -> None:
     setup_logging(level=log_level, log_file=log_file, log_format=log_format)
 
 
+async def _check_connectivity(engine: MigrationEngine) -> None:
+    """Probe both instances, closing the clients on the same event loop."""
+    try:
+        await engine._test_connectivity()
+    finally:
+        await engine.close()
+
+
 async def _run_migration(config: Config, dry_run: bool = False) -> None:
     """Run the migration process with progress display."""
     engine = MigrationEngine(config)
@@ -1,13 +1,29 @@
 """Configuration management for GitLab Migration Tool."""
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import IO, Optional, Dict, Any, Union
 from pathlib import Path
 import os
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 import yaml
 from dotenv import load_dotenv
 
+try:
+    # LibYAML's C parser is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml(raw: bytes) -> Any:
+    """Parse YAML once per distinct file content.
+
+    Callers must not mutate the result; it is shared between calls.
+    """
+    return yaml.load(raw, Loader=_YamlLoader)
+
 
 class GitLabInstanceConfig(BaseModel):
     """Configuration for a GitLab instance."""
@@ -20,30 +36,35 @@ class GitLabInstanceConfig(BaseModel):
     rate_limit_per_second: float = Field(
         default=10.0, description='API requests per second limit'
     )
+    cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description='Seconds to reuse cached GET responses (0 always revalidates)',
+    )
+    ratelimit_store: Optional[str] = Field(
+        default=None,
+        description='SQLite file for persisting rate-limit state across runs',
+    )
 
-    @validator('url')
+    @field_validator('url')
+    @classmethod
     def validate_url(cls, v):
         """Validate GitLab URL format."""
         if not v.startswith(('http://', 'https://')):
             raise ValueError('URL must start with http:// or https://')
         return v.rstrip('/')
 
-    @validator('token', 'oauth_token')
-    def validate_auth_token(cls, v, values):
-        """Validate that at least one authentication method is provided."""
-        # This will be called for both token and oauth_token fields
-        # We need to check if at least one is provided after both are processed
-        return v
-
-    @validator('oauth_token')
-    def validate_auth_complete(cls, v, values):
+    @field_validator('oauth_token')
+    @classmethod
+    def validate_auth_complete(cls, v, info: ValidationInfo):
         """Ensure at least one authentication method is provided."""
-        token = values.get('token')
+        token = info.data.get('token')
         if not token and not v:
             raise ValueError('Either token or oauth_token must be provided')
         return v
 
-    @validator('rate_limit_per_second')
+    @field_validator('rate_limit_per_second')
+    @classmethod
     def validate_rate_limit(cls, v):
         """Validate rate limit is positive."""
         if v <= 0:
@@ -77,23 +98,26 @@ class MigrationConfig(BaseModel):
         default=30, description='Concurrent members to process'
     )
 
-    @validator('batch_size')
+    @field_validator('batch_size')
+    @classmethod
     def validate_batch_size(cls, v):
         """Validate batch size is positive."""
         if v <= 0:
             raise ValueError('Batch size must be positive')
         return v
 
-    @validator('max_workers')
+    @field_validator('max_workers')
+    @classmethod
     def validate_max_workers(cls, v):
         """Validate max workers is positive."""
         if v <= 0:
             raise ValueError('Max workers must be positive')
         return v
 
-    @validator(
+    @field_validator(
         'user_batch_size', 'group_batch_size', 'project_batch_size', 'member_batch_size'
     )
+    @classmethod
     def validate_performance_batch_sizes(cls, v):
         """Validate performance batch sizes are positive."""
         if v <= 0:
@@ -128,7 +152,8 @@ class GitConfig(BaseModel):
         default=True, description='Preserve LFS objects during migration'
     )
 
-    @validator('temp_dir')
+    @field_validator('temp_dir')
+    @classmethod
     def validate_temp_dir(cls, v):
         """Validate temp directory path."""
         if v is not None:
@@ -141,7 +166,8 @@ class GitConfig(BaseModel):
                 raise ValueError(f'temp_dir path is not a directory: {v}')
         return v
 
-    @validator('timeout')
+    @field_validator('timeout')
+    @classmethod
     def validate_timeout(cls, v):
         """Validate timeout is positive."""
         if v <= 0:
@@ -159,7 +185,8 @@ class LoggingConfig(BaseModel):
         description='Log format',
     )
 
-    @validator('level')
+    @field_validator('level')
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
@@ -185,10 +212,7 @@ class Config(BaseModel):
         default_factory=LoggingConfig, description='Logging settings'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        extra = 'forbid'  # Don't allow extra fields
+    model_config = ConfigDict(extra='forbid')  # Don't allow extra fields
 
     @classmethod
     def from_file(cls, config_path: str) -> 'Config':
@@ -198,10 +222,17 @@ class Config(BaseModel):
         if not config_file.exists():
             raise FileNotFoundError(f'Configuration file not found: {config_path}')
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        # Keyed on content, so an edited file is always parsed again
+        config_data = _parse_yaml(config_file.read_bytes())
+
+        return cls.model_validate(config_data)
+
+    @classmethod
+    def from_stream(cls, stream: Union[str, bytes, IO]) -> 'Config':
+        """Load configuration from YAML text or an open file object."""
+        config_data = yaml.load(stream, Loader=_YamlLoader)
 
-        return cls(**config_data)
+        return cls.model_validate(config_data)
 
     @classmethod
     def from_env(cls) -> 'Config':
@@ -241,7 +272,7 @@ class Config(BaseModel):
         # Remove None values
         config_data = cls._remove_none_values(config_data)
 
-        return cls(**config_data)
+        return cls.model_validate(config_data)
 
     @staticmethod
     def _remove_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -261,7 +292,11 @@ class Config(BaseModel):
 
         with open(config_file, 'w', encoding='utf-8') as f:
             yaml.dump(
-                self.dict(), f, default_flow_style=False, indent=2, sort_keys=False
+                self.model_dump(),
+                f,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
             )
 
     def validate_connectivity(self) -> bool:
@@ -1,5 +1,6 @@
 """Migration engine - main entry point for migration operations."""
 
+import asyncio
 from typing import Optional
 from loguru import logger
 
@@ -22,8 +23,13 @@ class MigrationEngine:
         self.logger = logger.bind(component='MigrationEngine')
 
         # Initialize GitLab clients
-        self.source_client = GitLabClientFactory.create_client(config.source)
-        self.destination_client = GitLabClientFactory.create_client(config.destination)
+        max_workers = config.migration.max_workers
+        self.source_client = GitLabClientFactory.create_client(
+            config.source, max_workers=max_workers
+        )
+        self.destination_client = GitLabClientFactory.create_client(
+            config.destination, max_workers=max_workers
+        )
 
         # Create migration context with performance batch size settings
         self.context = MigrationContext(
@@ -69,9 +75,7 @@ class MigrationEngine:
             self.logger.error(f'Migration failed: {e}')
             raise
         finally:
-            # Clean up clients
-            self.source_client.close()
-            self.destination_client.close()
+            await self.close()
 
     async def dry_run(self, plan: Optional[MigrationPlan] = None) -> MigrationSummary:
         """Perform a dry run of the migration.
@@ -101,9 +105,7 @@ class MigrationEngine:
             self.logger.error(f'Dry run failed: {e}')
             raise
         finally:
-            # Clean up clients
-            self.source_client.close()
-            self.destination_client.close()
+            await self.close()
 
     def _create_default_plan(self) -> MigrationPlan:
         """Create default migration plan from configuration.
@@ -120,6 +122,11 @@ class MigrationEngine:
             max_concurrent_batches=5,  # Fixed value for orchestrator-level concurrency
         )
 
+    async def close(self) -> None:
+        """Close both GitLab clients and their HTTP sessions."""
+        await self.source_client.close_async()
+        await self.destination_client.close_async()
+
     async def _test_connectivity(self) -> None:
         """Test connectivity to both GitLab instances.
 
@@ -128,10 +135,16 @@ class MigrationEngine:
         """
         self.logger.info('Testing connectivity to GitLab instances')
 
-        if not self.source_client.test_connection():
+        # Both probes are independent, so run them concurrently
+        source_ok, destination_ok = await asyncio.gather(
+            self.source_client.test_connection_async(),
+            self.destination_client.test_connection_async(),
+        )
+
+        if not source_ok:
             raise ConnectionError('Cannot connect to source GitLab instance')
 
-        if not self.destination_client.test_connection():
+        if not destination_ok:
             raise ConnectionError('Cannot connect to destination GitLab instance')
 
         self.logger.info('Connectivity tests passed')
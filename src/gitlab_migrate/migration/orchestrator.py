@@ -5,7 +5,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from .strategy import (
     MigrationStrategy,
@@ -17,7 +17,7 @@ from .strategy import (
     ProjectMigrationStrategy,
     RepositoryMigrationStrategy,
 )
-from ..models.user import User
+from ..models.user import User, USER_LIST_ADAPTER
 from ..models.group import Group
 from ..models.project import Project
 from ..models.repository import Repository
@@ -68,11 +68,6 @@ class MigrationSummary(BaseModel):
         default_factory=list, description='All migration results'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class MigrationOrchestrator:
     """Orchestrates the migration of entities between GitLab instances."""
@@ -236,6 +231,13 @@ class MigrationOrchestrator:
             # Fetch users from source
             try:
                 users_data = self.context.source_client.get_paginated('/users')
+                try:
+                    # Validate the whole list in one pass when every record is valid
+                    return USER_LIST_ADAPTER.validate_python(users_data)
+                except ValidationError:
+                    # Fall back to per-item parsing so bad records are skipped
+                    pass
+
                 users = []
                 for user_data in users_data:
                     try:
@@ -252,7 +254,7 @@ class MigrationOrchestrator:
         elif entity_type == 'groups':
             # Fetch groups from source
             try:
-                groups_data = self.context.source_client.get_paginated('/groups')
+                groups_data = self.context.source_client.iter_paginated('/groups')
                 groups = []
                 for group_data in groups_data:
                     try:
@@ -269,7 +271,7 @@ class MigrationOrchestrator:
         elif entity_type == 'projects':
             # Fetch projects from source
             try:
-                projects_data = self.context.source_client.get_paginated('/projects')
+                projects_data = self.context.source_client.iter_paginated('/projects')
                 projects = []
                 for project_data in projects_data:
                     try:
@@ -15,7 +15,7 @@ from loguru import logger
 from ..api.client import GitLabClient
 from ..models.user import User, UserCreate, UserMapping
 from ..models.group import Group, GroupCreate, GroupMapping
-from ..models.project import Project, ProjectCreate, ProjectMapping
+from ..models.project import NamespaceRef, Project, ProjectCreate, ProjectMapping
 from ..models.repository import Repository, RepositoryMapping, RepositoryMigrationResult
 
 
@@ -62,11 +62,6 @@ class MigrationResult(BaseModel):
         default_factory=dict, description='Additional metadata'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class MigrationContext(BaseModel):
     """Context for migration operations."""
@@ -292,8 +287,8 @@ class UserMigrationStrategy(MigrationStrategy):
                     entity_id=str(user.id),
                     status=MigrationStatus.SKIPPED,
                     success=True,
-                    source_data=user.dict(),
-                    destination_data=existing_user.dict(),
+                    source_data=user.model_dump(),
+                    destination_data=existing_user.model_dump(),
                     metadata={'reason': 'user_already_exists'},
                 )
 
@@ -304,7 +299,7 @@ class UserMigrationStrategy(MigrationStrategy):
                     entity_id=str(user.id),
                     status=MigrationStatus.COMPLETED,
                     success=True,
-                    source_data=user.dict(),
+                    source_data=user.model_dump(),
                     metadata={'dry_run': True},
                 )
 
@@ -316,7 +311,7 @@ class UserMigrationStrategy(MigrationStrategy):
                     entity_id=str(user.id),
                     status=MigrationStatus.SKIPPED,
                     success=True,
-                    source_data=user.dict(),
+                    source_data=user.model_dump(),
                     metadata={'reason': 'system_or_bot_user'},
                 )
 
@@ -363,8 +358,8 @@ class UserMigrationStrategy(MigrationStrategy):
                     entity_id=str(user.id),
                     status=MigrationStatus.COMPLETED,
                     success=True,
-                    source_data=user.dict(),
-                    destination_data=new_user.dict(),
+                    source_data=user.model_dump(),
+                    destination_data=new_user.model_dump(),
                 )
             else:
                 error_msg = f'Failed to create user {user.username}: {response.data}'
@@ -375,7 +370,7 @@ class UserMigrationStrategy(MigrationStrategy):
                     status=MigrationStatus.FAILED,
                     success=False,
                     error_message=error_msg,
-                    source_data=user.dict(),
+                    source_data=user.model_dump(),
                 )
 
         except Exception as e:
@@ -387,7 +382,7 @@ class UserMigrationStrategy(MigrationStrategy):
                 status=MigrationStatus.FAILED,
                 success=False,
                 error_message=error_msg,
-                source_data=user.dict(),
+                source_data=user.model_dump(),
             )
 
     async def migrate_batch(self, users: List[User]) -> List[MigrationResult]:
@@ -711,7 +706,7 @@ class GroupMigrationStrategy(MigrationStrategy):
             List of group member data
         """
         try:
-            members_data = self.context.source_client.get_paginated(
+            members_data = self.context.source_client.iter_paginated(
                 f'/groups/{source_group_id}/members'
             )
             return list(members_data)
@@ -1001,7 +996,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                     entity_id=str(project.id),
                     status=MigrationStatus.COMPLETED,
                     success=True,
-                    source_data=project.dict(),
+                    source_data=project.dump(),
                     metadata={'dry_run': True},
                 )
 
@@ -1017,8 +1012,8 @@ class ProjectMigrationStrategy(MigrationStrategy):
                     entity_id=str(project.id),
                     status=MigrationStatus.SKIPPED,
                     success=True,
-                    source_data=project.dict(),
-                    destination_data=existing_project.dict(),
+                    source_data=project.dump(),
+                    destination_data=existing_project.dump(),
                     metadata={'reason': 'project_already_exists'},
                 )
 
@@ -1034,7 +1029,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                     entity_id=str(project.id),
                     status=MigrationStatus.SKIPPED,
                     success=True,  # Mark as success since we're intentionally skipping
-                    source_data=project.dict(),
+                    source_data=project.dump(),
                     metadata={
                         'reason': 'namespace_owner_not_migrated',
                         'skip_reason': 'missing_namespace_owner',
@@ -1063,7 +1058,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
             )
 
             # Log the exact project creation request
-            project_data = project_create.dict(exclude_none=True)
+            project_data = project_create.dump()
             self.logger.info(f'Creating project with data: {project_data}')
             self.logger.info(f'Project creation API endpoint: POST /projects')
             self.logger.info(f'Original project path: {project.path}')
@@ -1090,7 +1085,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                     wiki_enabled=project.wiki_enabled or True,
                     jobs_enabled=project.jobs_enabled or True,
                     snippets_enabled=project.snippets_enabled or True,
-                ).dict(exclude_none=True)
+                ).dump()
 
                 self.logger.info(
                     f'Attempt {retry_count + 1}/{max_retries + 1}: Creating project with path: {current_project_path}'
@@ -1140,8 +1135,8 @@ class ProjectMigrationStrategy(MigrationStrategy):
                         entity_id=str(project.id),
                         status=MigrationStatus.COMPLETED,
                         success=True,
-                        source_data=project.dict(),
-                        destination_data=new_project.dict(),
+                        source_data=project.dump(),
+                        destination_data=new_project.dump(),
                         metadata=metadata,
                     )
 
@@ -1174,7 +1169,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                             entity_id=str(project.id),
                             status=MigrationStatus.SKIPPED,
                             success=True,  # Mark as success since we're intentionally skipping
-                            source_data=project.dict(),
+                            source_data=project.dump(),
                             metadata={
                                 'reason': 'persistent_disk_conflict',
                                 'retries_attempted': max_retries,
@@ -1194,7 +1189,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                         status=MigrationStatus.FAILED,
                         success=False,
                         error_message=error_msg,
-                        source_data=project.dict(),
+                        source_data=project.dump(),
                     )
 
             # This should never be reached due to the logic above, but just in case
@@ -1206,7 +1201,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                 status=MigrationStatus.FAILED,
                 success=False,
                 error_message=error_msg,
-                source_data=project.dict(),
+                source_data=project.dump(),
             )
 
         except Exception as e:
@@ -1218,7 +1213,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
                 status=MigrationStatus.FAILED,
                 success=False,
                 error_message=error_msg,
-                source_data=project.dict(),
+                source_data=project.dump(),
             )
 
     async def migrate_batch(self, projects: List[Project]) -> List[MigrationResult]:
@@ -1278,8 +1273,8 @@ class ProjectMigrationStrategy(MigrationStrategy):
         """
         try:
             # Try to find project by full path (namespace/project)
-            if project.namespace and project.namespace.get('path'):
-                full_path = f'{project.namespace["path"]}/{project.path}'
+            if project.namespace and project.namespace.path:
+                full_path = f'{project.namespace.path}/{project.path}'
                 response = self.context.destination_client.get(
                     f'/projects/{full_path.replace("/", "%2F")}'
                 )
@@ -1323,11 +1318,10 @@ class ProjectMigrationStrategy(MigrationStrategy):
             if not project.namespace:
                 return None
 
-            namespace_data = project.namespace
-            namespace_kind = namespace_data.get('kind', 'user')
-            source_namespace_id = namespace_data.get('id')
-            namespace_path = namespace_data.get('path', '')
-            namespace_full_path = namespace_data.get('full_path', namespace_path)
+            namespace_kind = project.namespace.kind
+            source_namespace_id = project.namespace.id
+            namespace_path = project.namespace.path
+            namespace_full_path = project.namespace.full_path
 
             self.logger.info(
                 f'Resolving namespace for project {project.path}: '
@@ -1559,7 +1553,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
             List of project member data
         """
         try:
-            members_data = self.context.source_client.get_paginated(
+            members_data = self.context.source_client.iter_paginated(
                 f'/projects/{source_project_id}/members'
             )
             return list(members_data)
@@ -1819,11 +1813,8 @@ class ProjectMigrationStrategy(MigrationStrategy):
             if source_project.creator_id:
                 source_owner_id = source_project.creator_id
             # Check for owner in namespace (for user-owned projects)
-            elif (
-                source_project.namespace
-                and source_project.namespace.get('kind') == 'user'
-            ):
-                source_owner_id = source_project.namespace.get('id')
+            elif source_project.namespace and source_project.namespace.kind == 'user':
+                source_owner_id = source_project.namespace.id
 
             if not source_owner_id:
                 self.logger.debug(
@@ -1924,7 +1915,7 @@ class ProjectMigrationStrategy(MigrationStrategy):
             return fallback_path
 
     async def _path_exists_in_destination(
-        self, path: str, namespace: Optional[Dict[str, Any]]
+        self, path: str, namespace: Optional[NamespaceRef]
     ) -> bool:
         """Check if a project path already exists in the destination.
 
@@ -1937,8 +1928,8 @@ class ProjectMigrationStrategy(MigrationStrategy):
         """
         try:
             # Try to find project by full path (namespace/project)
-            if namespace and namespace.get('path'):
-                full_path = f'{namespace["path"]}/{path}'
+            if namespace and namespace.path:
+                full_path = f'{namespace.path}/{path}'
                 response = self.context.destination_client.get(
                     f'/projects/{full_path.replace("/", "%2F")}'
                 )
@@ -2076,7 +2067,7 @@ class RepositoryMigrationStrategy(MigrationStrategy):
                     entity_id=str(repository.project_id),
                     status=MigrationStatus.COMPLETED,
                     success=True,
-                    source_data=repository.dict(),
+                    source_data=repository.model_dump(),
                     metadata={'dry_run': True},
                 )
 
@@ -2092,7 +2083,7 @@ class RepositoryMigrationStrategy(MigrationStrategy):
                     status=MigrationStatus.FAILED,
                     success=False,
                     error_message=error_msg,
-                    source_data=repository.dict(),
+                    source_data=repository.model_dump(),
                 )
 
             destination_project_id = self.context.migrated_projects[
@@ -2117,7 +2108,7 @@ class RepositoryMigrationStrategy(MigrationStrategy):
                     entity_id=str(repository.project_id),
                     status=MigrationStatus.COMPLETED,
                     success=True,
-                    source_data=repository.dict(),
+                    source_data=repository.model_dump(),
                     metadata={
                         'destination_project_id': destination_project_id,
                         'branches_migrated': migration_result.branches_migrated,
@@ -2144,7 +2135,7 @@ class RepositoryMigrationStrategy(MigrationStrategy):
                     status=MigrationStatus.FAILED,
                     success=False,
                     error_message=error_msg,
-                    source_data=repository.dict(),
+                    source_data=repository.model_dump(),
                     warnings=warnings,
                 )
 
@@ -2157,7 +2148,7 @@ class RepositoryMigrationStrategy(MigrationStrategy):
                 status=MigrationStatus.FAILED,
                 success=False,
                 error_message=error_msg,
-                source_data=repository.dict(),
+                source_data=repository.model_dump(),
             )
 
     async def migrate_batch(
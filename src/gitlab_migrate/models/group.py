@@ -98,11 +98,6 @@ class Group(BaseModel):
             )
         return v
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class GroupCreate(BaseModel):
     """Model for creating a new group."""
@@ -240,11 +235,6 @@ class GroupMember(BaseModel):
         default=None, description='Membership expiration'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class GroupMemberAdd(BaseModel):
     """Model for adding a member to a group."""
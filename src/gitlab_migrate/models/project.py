@@ -1,11 +1,55 @@
 """Project entity models."""
 
+import re
+import sys
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator, validator
 
+_PATH_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
 
-class Project(BaseModel):
+# Allowed values, kept as tuples for stable ordering in error messages
+_VISIBILITY_CHOICES = ('private', 'internal', 'public')
+_MAPPING_METHOD_CHOICES = ('path_match', 'name_match', 'manual', 'create_new')
+
+_VISIBILITIES = frozenset(_VISIBILITY_CHOICES)
+_MAPPING_METHODS = frozenset(_MAPPING_METHOD_CHOICES)
+
+
+@lru_cache(maxsize=1024)
+def _intern_strings(values: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Intern tag/label strings so repeated sets share one tuple."""
+    return tuple(sys.intern(value) for value in values)
+
+
+class NamespaceRef(BaseModel):
+    """Compact reference to a project's namespace (group or user).
+
+    Serializes as an object with the same keys as the API's namespace.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[int] = None
+    kind: str = 'user'
+    path: str = ''
+    full_path: str = ''
+
+
+class _ProjectBaseModel(BaseModel):
+    """Base model for project entities."""
+
+    def dump(self) -> Dict[str, Any]:
+        """Dump the model to a dict, leaving out unset optional fields.
+
+        Returns:
+            Model data without None values
+        """
+        return self.model_dump(exclude_none=True)
+
+
+class Project(_ProjectBaseModel):
     """GitLab project model."""
 
     id: int = Field(..., description='Project ID')
@@ -23,7 +67,7 @@ class Project(BaseModel):
     http_url_to_repo: Optional[str] = Field(default=None, description='HTTP clone URL')
 
     # Namespace (group or user)
-    namespace: Optional[Dict[str, Any]] = Field(
+    namespace: Optional[NamespaceRef] = Field(
         default=None, description='Project namespace'
     )
 
@@ -42,8 +86,8 @@ class Project(BaseModel):
     default_branch: Optional[str] = Field(
         default=None, description='Default branch name'
     )
-    tag_list: List[str] = Field(default_factory=list, description='Project tags')
-    topics: List[str] = Field(default_factory=list, description='Project topics')
+    tag_list: Tuple[str, ...] = Field(default=(), description='Project tags')
+    topics: Tuple[str, ...] = Field(default=(), description='Project topics')
 
     # Settings
     issues_enabled: Optional[bool] = Field(default=None, description='Issues enabled')
@@ -133,29 +177,41 @@ class Project(BaseModel):
     @validator('visibility')
     def validate_visibility(cls, v):
         """Validate project visibility."""
-        valid_visibility = ['private', 'internal', 'public']
-        if v not in valid_visibility:
-            raise ValueError(f'Visibility must be one of: {valid_visibility}')
+        if v not in _VISIBILITIES:
+            raise ValueError(f'Visibility must be one of: {list(_VISIBILITY_CHOICES)}')
         return v
 
     @validator('path')
     def validate_path(cls, v):
         """Validate project path format."""
-        import re
-
-        if not re.match(r'^[a-zA-Z0-9._-]+$', v):
+        if not _PATH_RE.match(v):
             raise ValueError(
                 'Path can only contain alphanumeric characters, dots, dashes, and underscores'
             )
         return v
 
-    class Config:
-        """Pydantic configuration."""
+    @field_validator('namespace', mode='before')
+    @classmethod
+    def validate_namespace(cls, v):
+        """Reduce the API namespace dict to the fields migration uses."""
+        if isinstance(v, dict):
+            path = v.get('path', '')
+            return NamespaceRef(
+                id=v.get('id'),
+                kind=v.get('kind', 'user'),
+                path=path,
+                full_path=v.get('full_path', path),
+            )
+        return v
 
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    @field_validator('tag_list', 'topics', mode='after')
+    @classmethod
+    def intern_tags(cls, v):
+        """Intern tag and topic strings."""
+        return _intern_strings(v)
 
 
-class ProjectCreate(BaseModel):
+class ProjectCreate(_ProjectBaseModel):
     """Model for creating a new project."""
 
     name: str = Field(..., description='Project name')
@@ -224,25 +280,21 @@ class ProjectCreate(BaseModel):
     @validator('visibility')
     def validate_visibility(cls, v):
         """Validate project visibility."""
-        valid_visibility = ['private', 'internal', 'public']
-        if v not in valid_visibility:
-            raise ValueError(f'Visibility must be one of: {valid_visibility}')
+        if v not in _VISIBILITIES:
+            raise ValueError(f'Visibility must be one of: {list(_VISIBILITY_CHOICES)}')
         return v
 
     @validator('path')
     def validate_path(cls, v):
         """Validate project path format."""
-        if v is not None:
-            import re
-
-            if not re.match(r'^[a-zA-Z0-9._-]+$', v):
-                raise ValueError(
-                    'Path can only contain alphanumeric characters, dots, dashes, and underscores'
-                )
+        if v is not None and not _PATH_RE.match(v):
+            raise ValueError(
+                'Path can only contain alphanumeric characters, dots, dashes, and underscores'
+            )
         return v
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(_ProjectBaseModel):
     """Model for updating an existing project."""
 
     name: Optional[str] = Field(default=None, description='Project name')
@@ -275,14 +327,12 @@ class ProjectUpdate(BaseModel):
     @validator('visibility')
     def validate_visibility(cls, v):
         """Validate project visibility."""
-        if v is not None:
-            valid_visibility = ['private', 'internal', 'public']
-            if v not in valid_visibility:
-                raise ValueError(f'Visibility must be one of: {valid_visibility}')
+        if v is not None and v not in _VISIBILITIES:
+            raise ValueError(f'Visibility must be one of: {list(_VISIBILITY_CHOICES)}')
         return v
 
 
-class ProjectMember(BaseModel):
+class ProjectMember(_ProjectBaseModel):
     """Project member model."""
 
     id: int = Field(..., description='User ID')
@@ -302,37 +352,26 @@ class ProjectMember(BaseModel):
         default=None, description='Membership expiration'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
 
-
-class ProjectMemberAdd(BaseModel):
+class ProjectMemberAdd(_ProjectBaseModel):
     """Model for adding a member to a project."""
 
     user_id: int = Field(..., description='User ID to add')
-    access_level: int = Field(..., description='Access level')
+    access_level: Literal[10, 20, 30, 40, 50] = Field(..., description='Access level')
     expires_at: Optional[datetime] = Field(
         default=None, description='Membership expiration'
     )
 
-    @validator('access_level')
-    def validate_access_level(cls, v):
-        """Validate access level."""
-        valid_levels = [
-            10,
-            20,
-            30,
-            40,
-            50,
-        ]
-        if v not in valid_levels:
-            raise ValueError(f'Access level must be one of: {valid_levels}')
+    @field_validator('access_level', mode='before')
+    @classmethod
+    def coerce_access_level(cls, v):
+        """Accept numeric strings such as '30' from the CLI or config."""
+        if isinstance(v, str) and v.strip().isdigit():
+            return int(v)
         return v
 
 
-class ProjectMapping(BaseModel):
+class ProjectMapping(_ProjectBaseModel):
     """Model for mapping projects between source and destination."""
 
     source_project_id: int = Field(..., description='Source project ID')
@@ -353,7 +392,10 @@ class ProjectMapping(BaseModel):
 
     mapping_method: str = Field(..., description='How the mapping was determined')
     confidence: float = Field(
-        default=1.0, description='Confidence level of the mapping (0.0-1.0)'
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description='Confidence level of the mapping (0.0-1.0)',
     )
 
     created_at: datetime = Field(
@@ -363,23 +405,17 @@ class ProjectMapping(BaseModel):
         default=None, description='Additional notes about the mapping'
     )
 
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return v
-
     @validator('mapping_method')
     def validate_mapping_method(cls, v):
         """Validate mapping method."""
-        valid_methods = ['path_match', 'name_match', 'manual', 'create_new']
-        if v not in valid_methods:
-            raise ValueError(f'Mapping method must be one of: {valid_methods}')
+        if v not in _MAPPING_METHODS:
+            raise ValueError(
+                f'Mapping method must be one of: {list(_MAPPING_METHOD_CHOICES)}'
+            )
         return v
 
 
-class ProjectIssue(BaseModel):
+class ProjectIssue(_ProjectBaseModel):
     """Project issue model."""
 
     id: int = Field(..., description='Issue ID')
@@ -405,7 +441,7 @@ class ProjectIssue(BaseModel):
     closed_at: Optional[datetime] = Field(default=None, description='Closed timestamp')
 
     # Labels and milestone
-    labels: List[str] = Field(default_factory=list, description='Issue labels')
+    labels: Tuple[str, ...] = Field(default=(), description='Issue labels')
     milestone: Optional[Dict[str, Any]] = Field(
         default=None, description='Issue milestone'
     )
@@ -415,13 +451,14 @@ class ProjectIssue(BaseModel):
     downvotes: int = Field(default=0, description='Number of downvotes')
     user_notes_count: int = Field(default=0, description='Number of comments')
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    @field_validator('labels', mode='after')
+    @classmethod
+    def intern_labels(cls, v):
+        """Intern label strings."""
+        return _intern_strings(v)
 
 
-class ProjectMergeRequest(BaseModel):
+class ProjectMergeRequest(_ProjectBaseModel):
     """Project merge request model."""
 
     id: int = Field(..., description='MR ID')
@@ -455,7 +492,7 @@ class ProjectMergeRequest(BaseModel):
     closed_at: Optional[datetime] = Field(default=None, description='Closed timestamp')
 
     # Labels and milestone
-    labels: List[str] = Field(default_factory=list, description='MR labels')
+    labels: Tuple[str, ...] = Field(default=(), description='MR labels')
     milestone: Optional[Dict[str, Any]] = Field(
         default=None, description='MR milestone'
     )
@@ -473,7 +510,8 @@ class ProjectMergeRequest(BaseModel):
     downvotes: int = Field(default=0, description='Number of downvotes')
     user_notes_count: int = Field(default=0, description='Number of comments')
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    @field_validator('labels', mode='after')
+    @classmethod
+    def intern_labels(cls, v):
+        """Intern label strings."""
+        return _intern_strings(v)
@@ -1,8 +1,17 @@
 """Repository entity models."""
 
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_BRANCH_RE = re.compile(r'^[a-zA-Z0-9._/-]+$')
+
+# Allowed values for enum-like fields, checked by pydantic-core itself
+_MappingMethod = Literal['project_match', 'manual', 'create_new']
+_MigrationMethod = Literal['git_clone_push', 'api_export_import', 'direct_transfer']
+_Status = Literal['pending', 'in_progress', 'completed', 'failed', 'cancelled']
 
 
 class Repository(BaseModel):
@@ -20,12 +29,10 @@ class Repository(BaseModel):
     default_branch: Optional[str] = Field(
         default=None, description='Default branch name'
     )
-    branches: List[Dict[str, Any]] = Field(
-        default_factory=list, description='Repository branches'
-    )
-    tags: List[Dict[str, Any]] = Field(
-        default_factory=list, description='Repository tags'
+    branches: Tuple['RepositoryBranch', ...] = Field(
+        default=(), description='Repository branches'
     )
+    tags: Tuple['RepositoryTag', ...] = Field(default=(), description='Repository tags')
 
     # Repository statistics
     size: Optional[int] = Field(default=None, description='Repository size in bytes')
@@ -50,11 +57,6 @@ class Repository(BaseModel):
     )
     migration_notes: Optional[str] = Field(default=None, description='Migration notes')
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class RepositoryCreate(BaseModel):
     """Model for creating/initializing a repository."""
@@ -71,12 +73,11 @@ class RepositoryCreate(BaseModel):
     )
     mirror: bool = Field(default=False, description='Mirror repository')
 
-    @validator('default_branch')
+    @field_validator('default_branch')
+    @classmethod
     def validate_default_branch(cls, v):
         """Validate default branch name."""
-        import re
-
-        if not re.match(r'^[a-zA-Z0-9._/-]+$', v):
+        if not _BRANCH_RE.match(v):
             raise ValueError(
                 'Branch name can only contain alphanumeric characters, dots, dashes, slashes, and underscores'
             )
@@ -133,9 +134,7 @@ class RepositoryCommit(BaseModel):
     committed_date: datetime = Field(..., description='Committed date')
 
     # Commit details
-    parent_ids: List[str] = Field(
-        default_factory=list, description='Parent commit SHAs'
-    )
+    parent_ids: Tuple[str, ...] = Field(default=(), description='Parent commit SHAs')
     web_url: Optional[str] = Field(default=None, description='Web URL')
 
     # Statistics
@@ -143,11 +142,6 @@ class RepositoryCommit(BaseModel):
         default=None, description='Commit statistics'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class RepositoryFile(BaseModel):
     """Repository file model."""
@@ -165,20 +159,22 @@ class RepositoryFile(BaseModel):
     commit_id: str = Field(..., description='Last commit ID')
     last_commit_id: str = Field(..., description='Last commit ID for this file')
 
-    class Config:
-        """Pydantic configuration."""
 
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+@dataclass(frozen=True)
+class RepositoryTree:
+    """Repository tree (directory listing) entry.
 
+    A plain slotted dataclass rather than a pydantic model: tree listings are
+    fetched in bulk and every field is already a string in the API response.
+    """
 
-class RepositoryTree(BaseModel):
-    """Repository tree (directory listing) model."""
+    __slots__ = ('id', 'name', 'type', 'path', 'mode')
 
-    id: str = Field(..., description='Tree ID')
-    name: str = Field(..., description='File/directory name')
-    type: str = Field(..., description='Type (tree, blob)')
-    path: str = Field(..., description='Full path')
-    mode: str = Field(..., description='File mode')
+    id: str  # Tree ID
+    name: str  # File/directory name
+    type: str  # Type (tree, blob)
+    path: str  # Full path
+    mode: str  # File mode
 
 
 class RepositoryMirror(BaseModel):
@@ -200,11 +196,6 @@ class RepositoryMirror(BaseModel):
     )
     keep_divergent_refs: bool = Field(default=False, description='Keep divergent refs')
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class RepositoryHook(BaseModel):
     """Repository webhook model."""
@@ -249,25 +240,20 @@ class RepositoryHook(BaseModel):
         default=None, description='Creation timestamp'
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 class RepositoryProtectedBranch(BaseModel):
     """Protected branch configuration model."""
 
     id: int = Field(..., description='Protected branch ID')
     name: str = Field(..., description='Branch name')
-    push_access_levels: List[Dict[str, Any]] = Field(
-        default_factory=list, description='Push access levels'
+    push_access_levels: Tuple[Dict[str, Any], ...] = Field(
+        default=(), description='Push access levels'
     )
-    merge_access_levels: List[Dict[str, Any]] = Field(
-        default_factory=list, description='Merge access levels'
+    merge_access_levels: Tuple[Dict[str, Any], ...] = Field(
+        default=(), description='Merge access levels'
     )
-    unprotect_access_levels: List[Dict[str, Any]] = Field(
-        default_factory=list, description='Unprotect access levels'
+    unprotect_access_levels: Tuple[Dict[str, Any], ...] = Field(
+        default=(), description='Unprotect access levels'
     )
     code_owner_approval_required: bool = Field(
         default=False, description='Code owner approval required'
@@ -278,6 +264,9 @@ class RepositoryProtectedBranch(BaseModel):
 class RepositoryMapping(BaseModel):
     """Model for mapping repositories between source and destination."""
 
+    # Mappings are records; nothing updates them after construction
+    model_config = ConfigDict(frozen=True)
+
     source_project_id: int = Field(..., description='Source project ID')
     source_repository_path: str = Field(..., description='Source repository path')
 
@@ -288,15 +277,20 @@ class RepositoryMapping(BaseModel):
         default=None, description='Destination repository path'
     )
 
-    mapping_method: str = Field(..., description='How the mapping was determined')
+    mapping_method: _MappingMethod = Field(
+        ..., description='How the mapping was determined'
+    )
     confidence: float = Field(
-        default=1.0, description='Confidence level of the mapping (0.0-1.0)'
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description='Confidence level of the mapping (0.0-1.0)',
     )
 
     # Migration status
-    migration_status: str = Field(default='pending', description='Migration status')
+    migration_status: _Status = Field(default='pending', description='Migration status')
     migration_progress: float = Field(
-        default=0.0, description='Migration progress (0.0-1.0)'
+        default=0.0, ge=0.0, le=1.0, description='Migration progress (0.0-1.0)'
     )
 
     created_at: datetime = Field(
@@ -306,36 +300,6 @@ class RepositoryMapping(BaseModel):
         default=None, description='Additional notes about the mapping'
     )
 
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return v
-
-    @validator('migration_progress')
-    def validate_migration_progress(cls, v):
-        """Validate migration progress is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Migration progress must be between 0.0 and 1.0')
-        return v
-
-    @validator('mapping_method')
-    def validate_mapping_method(cls, v):
-        """Validate mapping method."""
-        valid_methods = ['project_match', 'manual', 'create_new']
-        if v not in valid_methods:
-            raise ValueError(f'Mapping method must be one of: {valid_methods}')
-        return v
-
-    @validator('migration_status')
-    def validate_migration_status(cls, v):
-        """Validate migration status."""
-        valid_statuses = ['pending', 'in_progress', 'completed', 'failed', 'cancelled']
-        if v not in valid_statuses:
-            raise ValueError(f'Migration status must be one of: {valid_statuses}')
-        return v
-
 
 class RepositoryMigrationResult(BaseModel):
     """Result of repository migration operation."""
@@ -343,13 +307,13 @@ class RepositoryMigrationResult(BaseModel):
     source_project_id: int = Field(..., description='Source project ID')
     destination_project_id: int = Field(..., description='Destination project ID')
 
-    migration_method: str = Field(..., description='Migration method used')
+    migration_method: _MigrationMethod = Field(..., description='Migration method used')
     started_at: datetime = Field(..., description='Migration start time')
     completed_at: Optional[datetime] = Field(
         default=None, description='Migration completion time'
     )
 
-    status: str = Field(..., description='Migration status')
+    status: _Status = Field(..., description='Migration status')
     success: bool = Field(..., description='Migration was successful')
 
     branches_migrated: int = Field(default=0, description='Number of branches migrated')
@@ -364,28 +328,8 @@ class RepositoryMigrationResult(BaseModel):
     )
     lfs_size_bytes: Optional[int] = Field(default=None, description='LFS size in bytes')
 
+    # Appended to while the migration runs, so these stay mutable lists
     errors: List[str] = Field(default_factory=list, description='Migration errors')
     warnings: List[str] = Field(default_factory=list, description='Migration warnings')
 
     notes: Optional[str] = Field(default=None, description='Additional notes')
-
-    @validator('migration_method')
-    def validate_migration_method(cls, v):
-        """Validate migration method."""
-        valid_methods = ['git_clone_push', 'api_export_import', 'direct_transfer']
-        if v not in valid_methods:
-            raise ValueError(f'Migration method must be one of: {valid_methods}')
-        return v
-
-    @validator('status')
-    def validate_status(cls, v):
-        """Validate migration status."""
-        valid_statuses = ['pending', 'in_progress', 'completed', 'failed', 'cancelled']
-        if v not in valid_statuses:
-            raise ValueError(f'Status must be one of: {valid_statuses}')
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
@@ -1,8 +1,17 @@
 """User entity models."""
 
+import re
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+
+# Allowed values for enum-like fields, checked by pydantic-core itself
+_State = Literal[
+    'active', 'blocked', 'deactivated', 'blocked_pending_approval', 'ldap_blocked'
+]
+_MappingMethod = Literal['email_match', 'username_match', 'manual', 'create_new']
 
 
 class User(BaseModel):
@@ -12,7 +21,7 @@ class User(BaseModel):
     username: str = Field(..., description='Username')
     name: str = Field(..., description='Full name')
     email: str = Field(..., description='Email address')
-    state: str = Field(..., description='User state (active, blocked, etc.)')
+    state: _State = Field(..., description='User state (active, blocked, etc.)')
     avatar_url: Optional[str] = Field(default=None, description='Avatar URL')
     web_url: Optional[str] = Field(default=None, description='Web URL')
 
@@ -68,31 +77,14 @@ class User(BaseModel):
     )
     migration_notes: Optional[str] = Field(default=None, description='Migration notes')
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Basic email validation."""
         if '@' not in v:
             raise ValueError('Invalid email format')
-        return v.lower()
-
-    @validator('state')
-    def validate_state(cls, v):
-        """Validate user state."""
-        valid_states = [
-            'active',
-            'blocked',
-            'deactivated',
-            'blocked_pending_approval',
-            'ldap_blocked',
-        ]
-        if v not in valid_states:
-            raise ValueError(f'State must be one of: {valid_states}')
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+        # Most addresses are already lower-case; avoid copying those
+        return v if v.islower() else v.lower()
 
 
 class UserCreate(BaseModel):
@@ -128,104 +120,22 @@ class UserCreate(BaseModel):
     admin: bool = Field(default=False, description='Admin user')
     skip_confirmation: bool = Field(default=True, description='Skip email confirmation')
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Basic email validation."""
         if '@' not in v:
             raise ValueError('Invalid email format')
-        return v.lower()
+        # Most addresses are already lower-case; avoid copying those
+        return v if v.islower() else v.lower()
 
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
         """Validate username format."""
         if len(v) < 2:
             raise ValueError('Username must be at least 2 characters')
-        import re
-
-        if not re.match(r'^[a-zA-Z0-9._-]+
-
-
-class UserUpdate(BaseModel):
-    """Model for updating an existing user."""
-
-    name: Optional[str] = Field(default=None, description='Full name')
-    email: Optional[str] = Field(default=None, description='Email address')
-
-    # Profile information
-    bio: Optional[str] = Field(default=None, description='User bio')
-    location: Optional[str] = Field(default=None, description='Location')
-    public_email: Optional[str] = Field(default=None, description='Public email')
-    skype: Optional[str] = Field(default=None, description='Skype username')
-    linkedin: Optional[str] = Field(default=None, description='LinkedIn profile')
-    twitter: Optional[str] = Field(default=None, description='Twitter handle')
-    website_url: Optional[str] = Field(default=None, description='Website URL')
-    organization: Optional[str] = Field(default=None, description='Organization')
-
-    # Access control
-    can_create_group: Optional[bool] = Field(
-        default=None, description='Can create groups'
-    )
-    can_create_project: Optional[bool] = Field(
-        default=None, description='Can create projects'
-    )
-    external: Optional[bool] = Field(default=None, description='External user')
-    private_profile: Optional[bool] = Field(default=None, description='Private profile')
-
-    # Limits
-    projects_limit: Optional[int] = Field(default=None, description='Project limit')
-
-    @validator('email')
-    def validate_email(cls, v):
-        """Basic email validation."""
-        if v and '@' not in v:
-            raise ValueError('Invalid email format')
-        return v.lower() if v else v
-
-
-class UserMapping(BaseModel):
-    """Model for mapping users between source and destination."""
-
-    source_user_id: int = Field(..., description='Source user ID')
-    source_username: str = Field(..., description='Source username')
-    source_email: str = Field(..., description='Source email')
-
-    destination_user_id: Optional[int] = Field(
-        default=None, description='Destination user ID'
-    )
-    destination_username: Optional[str] = Field(
-        default=None, description='Destination username'
-    )
-    destination_email: Optional[str] = Field(
-        default=None, description='Destination email'
-    )
-
-    mapping_method: str = Field(..., description='How the mapping was determined')
-    confidence: float = Field(
-        default=1.0, description='Confidence level of the mapping (0.0-1.0)'
-    )
-
-    created_at: datetime = Field(
-        default_factory=datetime.now, description='Mapping creation time'
-    )
-    notes: Optional[str] = Field(
-        default=None, description='Additional notes about the mapping'
-    )
-
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return v
-
-    @validator('mapping_method')
-    def validate_mapping_method(cls, v):
-        """Validate mapping method."""
-        valid_methods = ['email_match', 'username_match', 'manual', 'create_new']
-        if v not in valid_methods:
-            raise ValueError(f'Mapping method must be one of: {valid_methods}')
-        return v
-, v):
+        if not _USERNAME_RE.match(v):
             raise ValueError(
                 'Username can only contain alphanumeric characters, dots, dashes, and underscores'
             )
@@ -261,17 +171,23 @@ class UserUpdate(BaseModel):
     # Limits
     projects_limit: Optional[int] = Field(default=None, description='Project limit')
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Basic email validation."""
-        if v and '@' not in v:
+        if not v:
+            return v
+        if '@' not in v:
             raise ValueError('Invalid email format')
-        return v.lower() if v else v
+        return v if v.islower() else v.lower()
 
 
 class UserMapping(BaseModel):
     """Model for mapping users between source and destination."""
 
+    # Mappings are records; nothing updates them after construction
+    model_config = ConfigDict(frozen=True)
+
     source_user_id: int = Field(..., description='Source user ID')
     source_username: str = Field(..., description='Source username')
     source_email: str = Field(..., description='Source email')
@@ -286,9 +202,14 @@ class UserMapping(BaseModel):
         default=None, description='Destination email'
     )
 
-    mapping_method: str = Field(..., description='How the mapping was determined')
+    mapping_method: _MappingMethod = Field(
+        ..., description='How the mapping was determined'
+    )
     confidence: float = Field(
-        default=1.0, description='Confidence level of the mapping (0.0-1.0)'
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description='Confidence level of the mapping (0.0-1.0)',
     )
 
     created_at: datetime = Field(
@@ -298,17 +219,6 @@ class UserMapping(BaseModel):
         default=None, description='Additional notes about the mapping'
     )
 
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return v
 
-    @validator('mapping_method')
-    def validate_mapping_method(cls, v):
-        """Validate mapping method."""
-        valid_methods = ['email_match', 'username_match', 'manual', 'create_new']
-        if v not in valid_methods:
-            raise ValueError(f'Mapping method must be one of: {valid_methods}')
-        return v
+# Shared validator for whole pages of users from the API
+USER_LIST_ADAPTER = TypeAdapter(List[User])
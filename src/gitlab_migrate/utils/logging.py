@@ -1,11 +1,25 @@
 """Logging utilities for GitLab Migration Tool."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
+_DEFAULT_CONSOLE_FORMAT = (
+    '<green>{time:YYYY-MM-DD HH:mm:ss}</green> | '
+    '<level>{level: <8}</level> | '
+    '<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | '
+    '<level>{message}</level>'
+)
+_FILE_FORMAT = (
+    '{time:YYYY-MM-DD HH:mm:ss} | '
+    '{level: <8} | '
+    '{name}:{function}:{line} | '
+    '{message}'
+)
+
 
 def setup_logging(
     level: str = 'INFO',
@@ -22,43 +36,38 @@ def setup_logging(
     # Remove default handler
     logger.remove()
 
+    # Frame-variable introspection is slow and keeps tracebacks alive, so
+    # only enable it when debugging
+    debug = level.upper() == 'DEBUG'
+
     if log_format is None:
-        log_format = (
-            '<green>{time:YYYY-MM-DD HH:mm:ss}</green> | '
-            '<level>{level: <8}</level> | '
-            '<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | '
-            '<level>{message}</level>'
-        )
+        log_format = _DEFAULT_CONSOLE_FORMAT
 
     logger.add(
         sys.stderr,
         format=log_format,
         level=level,
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
+        colorize=sys.stderr.isatty(),
+        backtrace=debug,
+        diagnose=debug,
+        enqueue=True,
     )
 
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_format = (
-            '{time:YYYY-MM-DD HH:mm:ss} | '
-            '{level: <8} | '
-            '{name}:{function}:{line} | '
-            '{message}'
-        )
-
         logger.add(
             log_file,
-            format=file_format,
+            format=_FILE_FORMAT,
             level=level,
             rotation='10 MB',
             retention='30 days',
             compression='gz',
-            backtrace=True,
-            diagnose=True,
+            # Rotation and gzip run on the queue worker, not the caller
+            enqueue=True,
+            backtrace=debug,
+            diagnose=debug,
         )
 
     logger.info(f'Logging initialized with level: {level}')
@@ -66,6 +75,7 @@ def setup_logging(
         logger.info(f'Log file: {log_file}')
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str):
     """Get a logger instance with the given name.
 
@@ -0,0 +1,76 @@
+"""Shared test fixtures."""
+
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+VALID_CONFIG = """
+source:
+  url: https://source.gitlab.com
+  token: source-token
+
+destination:
+  url: https://dest.gitlab.com
+  token: dest-token
+"""
+
+
+def _fake_response(
+    status_code: int = 200,
+    json_data: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> SimpleNamespace:
+    """Build a plain stand-in for a requests.Response."""
+    content = json.dumps(json_data).encode() if json_data is not None else b''
+    return SimpleNamespace(
+        status_code=status_code,
+        json=lambda: json_data,
+        headers=headers or {},
+        content=content,
+        text=content.decode(),
+    )
+
+
+def _fake_aio_session(
+    status: int = 200,
+    body: bytes = b'',
+    headers: Optional[Dict[str, str]] = None,
+) -> MagicMock:
+    """Build an aiohttp ClientSession stand-in whose requests return one response."""
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=body)
+    response.__aenter__.return_value = response
+    response.__aexit__.return_value = None
+
+    session = MagicMock()
+    session.closed = False
+    session.request.return_value = response
+    return session
+
+
+@pytest.fixture
+def fake_response():
+    """Factory for lightweight HTTP response objects."""
+    return _fake_response
+
+
+@pytest.fixture
+def fake_aio_session():
+    """Factory for mocked aiohttp sessions."""
+    return _fake_aio_session
+
+
+@pytest.fixture(scope='session')
+def valid_config_path(tmp_path_factory):
+    """Path to a minimal valid config file, written once per session.
+
+    Shared by every test that uses it, so tests must not modify the file.
+    """
+    path = tmp_path_factory.mktemp('cfg') / 'config.yaml'
+    path.write_text(VALID_CONFIG)
+    return str(path)
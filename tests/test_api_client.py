@@ -1,7 +1,10 @@
 """Tests for GitLab API client."""
 
+import asyncio
+import sqlite3
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import requests
 import aiohttp
 
@@ -15,6 +18,15 @@ from src.gitlab_migrate.api.exceptions import (
 from src.gitlab_migrate.config.config import GitLabInstanceConfig
 
 
+def _read_rate_limit_row(path):
+    """Read the persisted (remaining, reset_at) through a separate connection."""
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute('SELECT remaining, reset_at FROM rl').fetchone()
+    finally:
+        conn.close()
+
+
 class TestAPIResponse:
     """Test API response model."""
 
@@ -73,6 +85,14 @@ class TestGitLabClient:
         with pytest.raises(GitLabAuthenticationError):
             GitLabClient(config)
 
+    def test_client_uses_pooled_adapter(self):
+        """Test the session mounts a sized connection pool."""
+        client = GitLabClient(self.config, max_workers=8)
+
+        adapter = client.session.get_adapter('https://x')
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] >= 16
+        assert adapter.max_retries.total == 3
+
     def test_build_url(self):
         """Test URL building."""
         client = GitLabClient(self.config)
@@ -84,17 +104,17 @@ class TestGitLabClient:
             client._build_url('/projects/1/issues')
             == 'https://gitlab.example.com/api/v4/projects/1/issues'
         )
+        assert (
+            client._build_url('//projects')
+            == 'https://gitlab.example.com/api/v4/projects'
+        )
 
     @patch('requests.Session.get')
-    def test_get_request_success(self, mock_get):
+    def test_get_request_success(self, mock_get, fake_response):
         """Test successful GET request."""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'id': 1, 'name': 'test'}
-        mock_response.headers = {'Content-Type': 'application/json'}
-        mock_response.content = b'{"id": 1, "name": "test"}'
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(
+            200, {'id': 1, 'name': 'test'}, {'Content-Type': 'application/json'}
+        )
 
         client = GitLabClient(self.config)
         response = client.get('/users')
@@ -105,25 +125,39 @@ class TestGitLabClient:
         mock_get.assert_called_once()
 
     @patch('requests.Session.get')
-    def test_get_request_404(self, mock_get):
-        """Test GET request with 404 error."""
+    def test_parser_uses_orjson_if_available(self, mock_get):
+        """Test response bodies are parsed with orjson when installed."""
+        orjson = pytest.importorskip('orjson')
         mock_response = Mock()
-        mock_response.status_code = 404
+        mock_response.status_code = 200
         mock_response.headers = {}
+        mock_response.content = b'{"id": 1}'
         mock_get.return_value = mock_response
 
+        client = GitLabClient(self.config)
+        with patch(
+            'src.gitlab_migrate.api.client._json_loads', wraps=orjson.loads
+        ) as mock_loads:
+            response = client.get('/users/1')
+
+        assert response.data == {'id': 1}
+        mock_loads.assert_called_once_with(b'{"id": 1}')
+        mock_response.json.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_get_request_404(self, mock_get, fake_response):
+        """Test GET request with 404 error."""
+        mock_get.return_value = fake_response(404)
+
         client = GitLabClient(self.config)
 
         with pytest.raises(GitLabNotFoundError):
             client.get('/nonexistent')
 
     @patch('requests.Session.get')
-    def test_get_request_401(self, mock_get):
+    def test_get_request_401(self, mock_get, fake_response):
         """Test GET request with authentication error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(401)
 
         client = GitLabClient(self.config)
 
@@ -131,12 +165,9 @@ class TestGitLabClient:
             client.get('/users')
 
     @patch('requests.Session.get')
-    def test_get_request_429(self, mock_get):
+    def test_get_request_429(self, mock_get, fake_response):
         """Test GET request with rate limit error."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {'Retry-After': '60'}
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(429, headers={'Retry-After': '60'})
 
         client = GitLabClient(self.config)
 
@@ -145,15 +176,64 @@ class TestGitLabClient:
 
         assert exc_info.value.retry_after == 60
 
+    @patch('requests.Session.get')
+    def test_4xx_skips_json_parse(self, mock_get):
+        """Test non-JSON error pages are not parsed."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.json.side_effect = RuntimeError('should not be called')
+        mock_get.return_value = mock_response
+
+        client = GitLabClient(self.config)
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            client.get('/users')
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.response_data is None
+
+    @patch('requests.Session.get')
+    def test_error_message_read_from_json_body(self, mock_get, fake_response):
+        """Test GitLab's JSON error message is kept."""
+        mock_get.return_value = fake_response(
+            422,
+            {'message': 'name has already been taken'},
+            headers={'Content-Type': 'application/json'},
+        )
+
+        client = GitLabClient(self.config)
+
+        with pytest.raises(GitLabAPIError, match='name has already been taken'):
+            client.get('/projects')
+
+    @patch('src.gitlab_migrate.api.client.time.sleep')
+    @patch('requests.Session.get')
+    def test_request_after_429_waits_for_retry_after(
+        self, mock_get, mock_sleep, fake_response
+    ):
+        """Test the request after a 429 waits out Retry-After first."""
+        mock_get.side_effect = [
+            fake_response(429, headers={'Retry-After': '60'}),
+            fake_response(200, []),
+        ]
+
+        client = GitLabClient(self.config)
+        with pytest.raises(GitLabRateLimitError):
+            client.get('/users')
+        mock_sleep.assert_not_called()
+
+        client.get('/users')
+
+        mock_sleep.assert_called_once()
+        assert 59 <= mock_sleep.call_args.args[0] <= 60
+
     @patch('requests.Session.post')
-    def test_post_request_success(self, mock_post):
+    def test_post_request_success(self, mock_post, fake_response):
         """Test successful POST request."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {'id': 2, 'name': 'created'}
-        mock_response.headers = {'Content-Type': 'application/json'}
-        mock_response.content = b'{"id": 2, "name": "created"}'
-        mock_post.return_value = mock_response
+        mock_post.return_value = fake_response(
+            201, {'id': 2, 'name': 'created'}, {'Content-Type': 'application/json'}
+        )
 
         client = GitLabClient(self.config)
         response = client.post('/users', data={'name': 'test'})
@@ -163,25 +243,26 @@ class TestGitLabClient:
         assert response.data == {'id': 2, 'name': 'created'}
         mock_post.assert_called_once()
 
+    @patch('requests.Session.post')
+    def test_post_body_encoded_with_orjson(self, mock_post, fake_response):
+        """Test request bodies are serialized with orjson when installed."""
+        orjson = pytest.importorskip('orjson')
+        mock_post.return_value = fake_response(201, {'id': 2})
+
+        client = GitLabClient(self.config)
+        client.post('/users', data={'name': 'test'})
+
+        _, kwargs = mock_post.call_args
+        assert kwargs['data'] == orjson.dumps({'name': 'test'})
+        assert 'json' not in kwargs
+
     @patch('requests.Session.get')
-    def test_get_paginated(self, mock_get):
+    def test_get_paginated(self, mock_get, fake_response):
         """Test paginated GET request."""
-        # Mock multiple pages of responses
+        headers = {'X-Total-Pages': '2', 'Content-Type': 'application/json'}
         responses = [
-            # Page 1
-            Mock(
-                status_code=200,
-                json=lambda: [{'id': 1}, {'id': 2}],
-                headers={'X-Total-Pages': '2', 'Content-Type': 'application/json'},
-                content=b'[{"id": 1}, {"id": 2}]',
-            ),
-            # Page 2
-            Mock(
-                status_code=200,
-                json=lambda: [{'id': 3}, {'id': 4}],
-                headers={'X-Total-Pages': '2', 'Content-Type': 'application/json'},
-                content=b'[{"id": 3}, {"id": 4}]',
-            ),
+            fake_response(200, [{'id': 1}, {'id': 2}], headers),  # Page 1
+            fake_response(200, [{'id': 3}, {'id': 4}], headers),  # Page 2
         ]
 
         mock_get.side_effect = responses
@@ -194,14 +275,110 @@ class TestGitLabClient:
         assert mock_get.call_count == 2
 
     @patch('requests.Session.get')
-    def test_test_connection_success(self, mock_get):
+    def test_rate_limit_persists_across_instances(
+        self, mock_get, fake_response, tmp_path
+    ):
+        """Test a new client resumes the budget a previous one saw."""
+        config = self.config.model_copy(
+            update={'ratelimit_store': str(tmp_path / 'ratelimit.db')}
+        )
+        reset_at = int(time.time()) + 60
+        mock_get.return_value = fake_response(
+            200,
+            [],
+            {'RateLimit-Remaining': '5', 'RateLimit-Reset': str(reset_at)},
+        )
+
+        client = GitLabClient(config)
+        client.get('/users')
+        client.close()
+
+        client = GitLabClient(config)
+        assert client._ratelimit.remaining == 5
+        assert client._ratelimit.reset_at == reset_at
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_rate_limit_store_written_once_per_window(
+        self, mock_get, fake_response, tmp_path
+    ):
+        """Test a healthy budget is written once per window, not per response."""
+        path = tmp_path / 'ratelimit.db'
+        config = self.config.model_copy(update={'ratelimit_store': str(path)})
+        reset = str(int(time.time()) + 60)
+        mock_get.side_effect = [
+            fake_response(
+                200, [], {'RateLimit-Remaining': str(n), 'RateLimit-Reset': reset}
+            )
+            for n in (90, 89, 88)
+        ]
+
+        client = GitLabClient(config)
+        for _ in range(3):
+            client.get('/users')
+
+        assert _read_rate_limit_row(path) == (90, float(reset))
+        client.close()
+        assert _read_rate_limit_row(path) == (88, float(reset))
+
+    @patch('requests.Session.get')
+    def test_low_rate_limit_budget_written_immediately(
+        self, mock_get, fake_response, tmp_path
+    ):
+        """Test a low budget reaches the store without waiting for close()."""
+        path = tmp_path / 'ratelimit.db'
+        config = self.config.model_copy(update={'ratelimit_store': str(path)})
+        reset = str(int(time.time()) + 60)
+        mock_get.side_effect = [
+            fake_response(
+                200, [], {'RateLimit-Remaining': str(n), 'RateLimit-Reset': reset}
+            )
+            for n in (90, 3, 0)
+        ]
+
+        client = GitLabClient(config)
+        client.get('/users')
+        client.get('/users')
+        assert _read_rate_limit_row(path) == (3, float(reset))
+
+        client.get('/users')
+        # No close(): the row must already be current, as after a crash
+        assert _read_rate_limit_row(path) == (0, float(reset))
+        client.close()
+
+    def test_unwritable_rate_limit_store_is_ignored(self, tmp_path):
+        """Test an unusable store path falls back to in-memory state."""
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+        config = self.config.model_copy(
+            update={'ratelimit_store': str(blocker / 'ratelimit.db')}
+        )
+
+        client = GitLabClient(config)
+
+        assert client._rl_store is None
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_iter_paginated_is_lazy(self, mock_get, fake_response):
+        """Test pages are only fetched as items are consumed."""
+        mock_get.side_effect = [
+            fake_response(200, [{'id': 1}, {'id': 2}], {'X-Total-Pages': '2'}),
+            fake_response(200, [{'id': 3}], {'X-Total-Pages': '2'}),
+        ]
+
+        client = GitLabClient(self.config)
+        items = client.iter_paginated('/users', per_page=2)
+
+        assert next(items) == {'id': 1}
+        assert mock_get.call_count == 1
+        assert list(items) == [{'id': 2}, {'id': 3}]
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_test_connection_success(self, mock_get, fake_response):
         """Test successful connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'id': 1, 'username': 'test'}
-        mock_response.headers = {}
-        mock_response.content = b'{"id": 1, "username": "test"}'
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(200, {'id': 1, 'username': 'test'})
 
         client = GitLabClient(self.config)
         result = client.test_connection()
@@ -222,14 +399,9 @@ class TestGitLabClient:
         assert result is False
 
     @patch('requests.Session.get')
-    def test_get_version(self, mock_get):
+    def test_get_version(self, mock_get, fake_response):
         """Test GitLab version retrieval."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'version': '15.0.0'}
-        mock_response.headers = {}
-        mock_response.content = b'{"version": "15.0.0"}'
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_response(200, {'version': '15.0.0'})
 
         client = GitLabClient(self.config)
         version = client.get_version()
@@ -244,6 +416,73 @@ class TestGitLabClient:
             mock_close.assert_called_once()
 
 
+class TestCache:
+    """Test GET response caching."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = GitLabInstanceConfig(
+            url='https://gitlab.example.com',
+            token='test-token',
+            cache_ttl=60,
+        )
+
+    @patch('requests.Session.get')
+    def test_fresh_response_skips_request(self, mock_get, fake_response):
+        """Test identical GETs within the TTL hit the network once."""
+        mock_get.return_value = fake_response(200, [{'id': 1}])
+
+        client = GitLabClient(self.config)
+        first = client.get('/users')
+        second = client.get('/users')
+
+        assert second == first
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_cached_data_is_not_shared(self, mock_get, fake_response):
+        """Test mutating a returned response does not corrupt the cache."""
+        mock_get.return_value = fake_response(200, [{'id': 1}])
+
+        client = GitLabClient(self.config)
+        client.get('/users').data.append({'id': 2})
+        client.get('/users').data[0]['id'] = 3
+
+        assert client.get('/users').data == [{'id': 1}]
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_paginated_requests_are_not_cached(self, mock_get, fake_response):
+        """Test pages fetched by pagination never enter the cache."""
+        mock_get.return_value = fake_response(200, [{'id': 1}], {'ETag': 'W/"p"'})
+
+        client = GitLabClient(self.config)
+        list(client.iter_paginated('/users'))
+        client.get('/users', params={'page': 1, 'per_page': 100})
+
+        assert len(client._cache) == 0
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_not_modified_returns_cached_data(self, mock_get, fake_response):
+        """Test a 304 revalidation replays the cached response."""
+        config = GitLabInstanceConfig(
+            url='https://gitlab.example.com', token='test-token'
+        )
+        mock_get.side_effect = [
+            fake_response(200, [{'id': 1}], {'ETag': 'W/"abc"'}),
+            fake_response(304, headers={'ETag': 'W/"abc"'}),
+        ]
+
+        client = GitLabClient(config)
+        client.get('/users')
+        response = client.get('/users')
+
+        assert response.data == [{'id': 1}]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': 'W/"abc"'}
+
+
 class TestGitLabClientFactory:
     """Test GitLab client factory."""
 
@@ -289,26 +528,11 @@ class TestAsyncMethods:
 
     @pytest.mark.asyncio
     @patch('aiohttp.ClientSession.request')
-    async def test_get_async_success(self, mock_request):
+    async def test_get_async_success(self, mock_request, fake_aio_session):
         """Test successful async GET request."""
-        # Mock aiohttp response
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.headers = {'Content-Type': 'application/json'}
-
-        # Make json() method return a coroutine
-        async def mock_json():
-            return {'id': 1, 'name': 'test'}
-
-        mock_response.json = mock_json
-        mock_response.content_length = 100
-        mock_response.__aenter__.return_value = mock_response
-        mock_response.__aexit__.return_value = None
-
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session.__aenter__.return_value = mock_session
-        mock_session.__aexit__.return_value = None
+        mock_session = fake_aio_session(
+            200, b'{"id": 1, "name": "test"}', {'Content-Type': 'application/json'}
+        )
 
         with patch('aiohttp.ClientSession', return_value=mock_session):
             client = GitLabClient(self.config)
@@ -316,24 +540,159 @@ class TestAsyncMethods:
 
             assert response.success is True
             assert response.status_code == 200
+            assert response.data == {'id': 1, 'name': 'test'}
 
     @pytest.mark.asyncio
     @patch('aiohttp.ClientSession.request')
-    async def test_get_async_404(self, mock_request):
+    async def test_get_async_404(self, mock_request, fake_aio_session):
         """Test async GET request with 404 error."""
-        mock_response = MagicMock()
-        mock_response.status = 404
-        mock_response.headers = {}
-        mock_response.__aenter__.return_value = mock_response
-        mock_response.__aexit__.return_value = None
-
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session.__aenter__.return_value = mock_session
-        mock_session.__aexit__.return_value = None
+        mock_session = fake_aio_session(404)
 
         with patch('aiohttp.ClientSession', return_value=mock_session):
             client = GitLabClient(self.config)
 
             with pytest.raises(GitLabNotFoundError):
                 await client.get_async('/nonexistent')
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_all_wait_for_rate_limit(self):
+        """Test every concurrent request waits once the budget is spent."""
+        client = GitLabClient(self.config)
+        client._ratelimit.remaining = 0
+        client._ratelimit.reset_at = time.time() + 30
+
+        with patch(
+            'src.gitlab_migrate.api.client.asyncio.sleep', new_callable=AsyncMock
+        ) as mock_sleep:
+            await asyncio.gather(
+                *(client._wait_for_rate_limit_async() for _ in range(5))
+            )
+
+        assert mock_sleep.await_count == 5
+        assert all(29 <= call.args[0] <= 30 for call in mock_sleep.await_args_list)
+
+    def test_rate_limit_forgotten_after_reset(self):
+        """Test an expired window no longer delays requests."""
+        client = GitLabClient(self.config)
+        client._ratelimit.remaining = 0
+        client._ratelimit.reset_at = time.time() - 1
+
+        assert client._rate_limit_delay() == 0.0
+        assert client._ratelimit.remaining is None
+
+    @pytest.mark.asyncio
+    async def test_async_session_is_reused(self, fake_aio_session):
+        """Test consecutive async requests share one aiohttp session."""
+        mock_session = fake_aio_session(200, b'{"id": 1}')
+
+        with patch('aiohttp.TCPConnector'):
+            with patch('aiohttp.ClientSession', return_value=mock_session) as mock_cls:
+                client = GitLabClient(self.config)
+                await client.get_async('/users')
+                await client.get_async('/groups')
+
+        assert mock_cls.call_count == 1
+        assert mock_session.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_aio_connector_has_dns_cache(self, fake_aio_session):
+        """Test the aiohttp connector caches DNS lookups."""
+        mock_session = fake_aio_session(200, b'[]')
+
+        with patch('aiohttp.ClientSession', return_value=mock_session) as mock_cls:
+            client = GitLabClient(self.config)
+            await client.get_async('/users')
+
+        connector = mock_cls.call_args.kwargs['connector']
+        try:
+            assert connector._use_dns_cache is True
+            assert connector.limit_per_host == connector.limit
+        finally:
+            await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_session_from_other_loop_is_not_replaced(self):
+        """Test an open session is not silently dropped on a new loop."""
+        client = GitLabClient(self.config)
+        stale_session = MagicMock()
+        stale_session.closed = False
+        client._aio_session = stale_session
+        client._aio_loop = object()
+
+        with pytest.raises(RuntimeError):
+            await client.get_async('/users')
+
+        assert client._aio_session is stale_session
+
+    @pytest.mark.asyncio
+    async def test_get_paginated_async(self):
+        """Test remaining pages are fetched concurrently after the first."""
+        pages = {
+            1: [{'id': 1}, {'id': 2}],
+            2: [{'id': 3}, {'id': 4}],
+            3: [{'id': 5}],
+        }
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get_async(endpoint, params=None, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return APIResponse(
+                status_code=200,
+                data=pages[params['page']],
+                headers={'X-Total-Pages': '3'},
+                success=True,
+            )
+
+        client = GitLabClient(self.config)
+        with patch.object(client, 'get_async', side_effect=fake_get_async) as mock:
+            items = await client.get_paginated_async('/users', per_page=2)
+
+        assert items == [{'id': n} for n in range(1, 6)]
+        assert mock.call_count == 3
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_get(self):
+        """Test batch GETs run concurrently and keep per-endpoint errors."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get_async(endpoint, params=None, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if endpoint == '/projects/2':
+                raise GitLabNotFoundError('Resource not found')
+            return APIResponse(
+                status_code=200, data={'id': 1}, headers={}, success=True
+            )
+
+        client = GitLabClient(self.config)
+        with patch.object(client, 'get_async', side_effect=fake_get_async):
+            results = await client.batch_get(['/projects/1', '/projects/2'])
+
+        assert results[0].data == {'id': 1}
+        assert isinstance(results[1], GitLabNotFoundError)
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_test_connection_async(self):
+        """Test async connection test reports success and failure."""
+        client = GitLabClient(self.config)
+        ok = APIResponse(status_code=200, data={'id': 1}, headers={}, success=True)
+
+        with patch.object(client, 'get_async', AsyncMock(return_value=ok)) as mock:
+            assert await client.test_connection_async() is True
+            mock.assert_awaited_once_with('/user')
+
+        with patch.object(
+            client, 'get_async', AsyncMock(side_effect=GitLabAPIError('down'))
+        ):
+            assert await client.test_connection_async() is False
@@ -1,10 +1,12 @@
 """Tests for CLI interface."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from click.testing import CliRunner
-import tempfile
 import os
+import subprocess
+import sys
 
 from src.gitlab_migrate.cli.main import cli, init, migrate, validate, status
 from src.gitlab_migrate.config.config import Config, GitLabInstanceConfig
@@ -37,8 +39,8 @@ class TestCLI:
 
     def test_init_command(self):
         """Test init command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, 'test_config.yaml')
+        with self.runner.isolated_filesystem():
+            config_path = 'test_config.yaml'
 
             result = self.runner.invoke(init, ['--output', config_path])
 
@@ -55,19 +57,35 @@ class TestCLI:
 
     def test_init_command_default_output(self):
         """Test init command with default output."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Change to temp directory
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(init)
 
-            try:
-                result = self.runner.invoke(init)
-
-                assert result.exit_code == 0
-                assert 'Configuration template created' in result.output
-                assert os.path.exists('config.yaml')
-            finally:
-                os.chdir(original_cwd)
+            assert result.exit_code == 0
+            assert 'Configuration template created' in result.output
+            assert os.path.exists('config.yaml')
+
+    def test_init_does_not_import_aiohttp(self, tmp_path):
+        """Test sync-only commands never load aiohttp."""
+        config_path = str(tmp_path / 'test_config.yaml')
+        script = (
+            'import sys\n'
+            'from click.testing import CliRunner\n'
+            'from src.gitlab_migrate.cli.main import cli\n'
+            f'result = CliRunner().invoke(cli, ["init", "--output", {config_path!r}])\n'
+            'assert result.exit_code == 0, result.output\n'
+            'print("aiohttp" in sys.modules)\n'
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == 'False'
 
     @patch('src.gitlab_migrate.cli.main._load_config')
     @patch('src.gitlab_migrate.cli.main._run_migration')
@@ -122,8 +140,8 @@ class TestCLI:
         assert 'Migration failed' in result.output
 
     @patch('src.gitlab_migrate.cli.main._load_config')
-    @patch('asyncio.run')
-    def test_validate_command_success(self, mock_asyncio_run, mock_load_config):
+    @patch('src.gitlab_migrate.cli.main._run_async')
+    def test_validate_command_success(self, mock_run_async, mock_load_config):
         """Test successful validate command."""
         # Mock configuration
         mock_config = Mock(spec=Config)
@@ -131,8 +149,9 @@ class TestCLI:
 
         # Mock engine and connectivity test
         mock_engine = Mock()
-        mock_engine._test_connectivity.return_value = None
-        mock_asyncio_run.return_value = None
+        mock_engine._test_connectivity = AsyncMock(return_value=None)
+        mock_engine.close = AsyncMock()
+        mock_run_async.side_effect = asyncio.run
 
         with patch(
             'src.gitlab_migrate.cli.main.MigrationEngine', return_value=mock_engine
@@ -142,6 +161,7 @@ class TestCLI:
             assert result.exit_code == 0
             assert 'Connectivity validation passed' in result.output
             assert 'Configuration validation completed' in result.output
+            mock_engine.close.assert_awaited_once()
 
     @patch('src.gitlab_migrate.cli.main._load_config')
     def test_validate_command_failure(self, mock_load_config):
@@ -198,29 +218,12 @@ class TestCLI:
         assert result.exit_code == 1
         assert 'Failed to load status' in result.output
 
-    def test_config_loading_with_file(self):
+    def test_config_loading_with_file(self, valid_config_path):
         """Test configuration loading with specified file."""
-        config_content = """
-source:
-  url: https://source.gitlab.com
-  token: source-token
-
-destination:
-  url: https://dest.gitlab.com
-  token: dest-token
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_content)
-            f.flush()
-
-            try:
-                result = self.runner.invoke(cli, ['--config', f.name, 'status'])
-                # This would fail because Config.from_file needs to be implemented properly
-                # but we're testing the CLI argument parsing
-                assert '--config' in str(result)
-            finally:
-                os.unlink(f.name)
+        result = self.runner.invoke(cli, ['--config', valid_config_path, 'status'])
+        # This would fail because Config.from_file needs to be implemented properly
+        # but we're testing the CLI argument parsing
+        assert '--config' in str(result)
 
     def test_verbose_flag(self):
         """Test verbose flag."""
@@ -299,6 +302,28 @@ class TestConfigLoading:
             assert config == mock_config
             mock_from_file.assert_called_once_with('config.yaml')
 
+    def test_load_config_revalidates_each_time(self, tmp_path):
+        """Test every load runs validators and returns an independent config."""
+        from src.gitlab_migrate.cli.main import _load_config
+
+        temp_dir = tmp_path / 'work'
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text(
+            'source: {url: https://source.example.com, token: source-token}\n'
+            'destination: {url: https://dest.example.com, token: dest-token}\n'
+            f'git: {{temp_dir: {temp_dir}}}\n'
+        )
+        mock_ctx = Mock()
+        mock_ctx.obj = {'config_path': str(config_path)}
+
+        first = _load_config(mock_ctx)
+        first.migration.dry_run = True
+        temp_dir.rmdir()
+        second = _load_config(mock_ctx)
+
+        assert temp_dir.is_dir()
+        assert second.migration.dry_run is False
+
     @patch('src.gitlab_migrate.config.config.Config.from_env')
     def test_load_config_from_env(self, mock_from_env):
         """Test loading config from environment variables."""
@@ -345,8 +370,8 @@ class TestCLIIntegration:
 
     def test_full_workflow_simulation(self):
         """Test a complete workflow simulation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, 'config.yaml')
+        with self.runner.isolated_filesystem():
+            config_path = 'config.yaml'
 
             # Step 1: Initialize configuration
             result = self.runner.invoke(init, ['--output', config_path])
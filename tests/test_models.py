@@ -0,0 +1,83 @@
+"""Tests for entity models."""
+
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from src.gitlab_migrate.models.project import NamespaceRef, Project, ProjectMemberAdd
+
+
+class TestProject:
+    """Test project model."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.data = {
+            'id': 1,
+            'name': 'Project',
+            'path': 'project',
+            'visibility': 'private',
+            'namespace': {
+                'id': 3,
+                'name': 'Group',
+                'kind': 'group',
+                'path': 'g',
+                'full_path': 'parent/g',
+                'avatar_url': None,
+            },
+        }
+
+    def test_namespace_reduced_to_ref(self):
+        """Test the API namespace dict is reduced to the fields used."""
+        project = Project(**self.data)
+
+        assert project.namespace == NamespaceRef(
+            id=3, kind='group', path='g', full_path='parent/g'
+        )
+
+    def test_namespace_dumps_as_object(self):
+        """Test namespace serializes as an object and round-trips."""
+        project = Project(**self.data)
+        dumped = project.dump()
+
+        assert dumped['namespace'] == {
+            'id': 3,
+            'kind': 'group',
+            'path': 'g',
+            'full_path': 'parent/g',
+        }
+        assert '"namespace":{"id":3,"kind":"group"' in project.model_dump_json()
+        assert Project(**dumped) == project
+
+    def test_tags_interned_as_tuples(self):
+        """Test tag and topic lists become tuples of interned strings."""
+        tag = ''.join(['b', 'u', 'g'])
+        project = Project(**self.data, tag_list=[tag], topics=[tag])
+
+        assert project.tag_list == ('bug',)
+        assert project.tag_list[0] is sys.intern('bug')
+        assert project.topics[0] is project.tag_list[0]
+
+    def test_json_schema(self):
+        """Test the project model can produce a JSON schema."""
+        schema = Project.model_json_schema()
+
+        assert 'forked_from_project' in schema['properties']
+
+
+class TestProjectMemberAdd:
+    """Test project member model."""
+
+    @pytest.mark.parametrize('access_level', [30, '30'])
+    def test_access_level_accepts_int_and_numeric_string(self, access_level):
+        """Test access levels given as strings are coerced."""
+        member = ProjectMemberAdd(user_id=1, access_level=access_level)
+
+        assert member.access_level == 30
+
+    @pytest.mark.parametrize('access_level', [35, '35', 'developer'])
+    def test_invalid_access_level(self, access_level):
+        """Test unknown access levels are rejected."""
+        with pytest.raises(ValidationError):
+            ProjectMemberAdd(user_id=1, access_level=access_level)